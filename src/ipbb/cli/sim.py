@@ -26,7 +26,7 @@ def sim(env, proj):
 def process_sim(env, subcommands, proj):
 
     from ..cmds.sim import sim
-    sim(env, proj)
+    sim(env, proj, [name for name,_,_,_ in subcommands])
 
     # Executed the chained commands
     for name, cmd, args, kwargs in subcommands:
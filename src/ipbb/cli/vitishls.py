@@ -28,7 +28,7 @@ def vitishls(env, proj, verbosity):
 @click.pass_obj
 def process_vitishls(env, subcommands, proj, verbosity):
     from ..cmds.vitishls import vitishls
-    vitishls(env, proj, verbosity)
+    vitishls(env, proj, verbosity, [name for name,_,_,_ in subcommands])
 
     # Executed the chained commands
     for name, cmd, args, kwargs in subcommands:
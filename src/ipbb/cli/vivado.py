@@ -9,8 +9,9 @@ import importlib
 @click.group('vivado', short_help='Set up, syntesize, implement Vivado projects.', chain=True)
 # @click.option('-p', '--proj', default=None, help="Selected project, if not current")
 @click.option('-l', '--loglevel', type=click.Choice(['all', 'info', 'warn', 'cwarn', 'error', 'fatal', 'none']), default='all', help="Silence vivado messages")
+@click.option('--framed', is_flag=True, default=False, help="Read command results from framed replies instead of scraping Vivado's output")
 @click.pass_obj
-def vivado(ictx, loglevel):
+def vivado(ictx, loglevel, framed):
     '''Vivado command group
     
     \b
@@ -26,10 +27,10 @@ def vivado(ictx, loglevel):
 # ------------------------------------------------------------------------------
 @vivado.resultcallback()
 @click.pass_obj
-def process_vivado(ictx, subcommands, loglevel):
+def process_vivado(ictx, subcommands, loglevel, framed):
 
     from ..cmds.vivado import vivado
-    vivado(ictx, loglevel, (name for name,_,_,_ in subcommands))
+    vivado(ictx, loglevel, (name for name,_,_,_ in subcommands), framed)
 
     # Executed the chained commands
     for name, cmd, args, kwargs in subcommands:
@@ -172,6 +173,23 @@ def reset(ictx, *args, **kwargs):
     return (ictx.command.name, reset, args, kwargs)
 
 
+# ------------------------------------------------------------------------------
+@vivado.command('session', short_help="Start, stop or query a detached Vivado session for this project area.")
+@click.argument('action', type=click.Choice(['start', 'stop', 'status']))
+@click.option('--idle-timeout', 'aIdleTimeout', type=float, default=0, help="Stop the session after the given number of seconds without clients (start only)")
+@click.pass_obj
+@click.pass_context
+def session(ictx, *args, **kwargs):
+    '''Manage a detached Vivado session for the current project area.
+
+    \b
+    While the session is running, the other vivado commands attach to it rather
+    than starting Vivado, and the project is only opened once.
+    '''
+    from ..cmds.vivado import session
+    return (ictx.command.name, session, args, kwargs)
+
+
 # ------------------------------------------------------------------------------
 @vivado.command('package', short_help="Package the firmware image and metadata into a standalone archive")
 @click.option('--tag', '-t', 'aTag', default=None, help="Optional tag to add to the archive name.")
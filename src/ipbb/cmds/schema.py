@@ -1,6 +1,6 @@
-import cerberus
 from ..console import cprint, console
 from ..utils import error_notice
+from ..utils.validation import validate
 
 project_schema = {
     'toolset': {'type': 'string', 'allowed': ['sim', 'vivado', 'vitis_hls'], 'required': True},
@@ -16,11 +16,12 @@ project_schema = {
 #------------------------------------------------------------------------------
 def validate_schema(schema, settings):
 
-    lValidator = cerberus.Validator(schema, allow_unknown=True)
-    if not lValidator.validate(settings.dict()):
+    lSettings = settings.dict()
+    lErrors = validate(schema, lSettings, allow_unknown=True)
+    if lErrors:
         error_notice(f"""Project settings validation failed
-               Detected errors: {lValidator.errors}
-               Settings: {settings.dict()}
+               Detected errors: {lErrors}
+               Settings: {lSettings}
                """)
 
-        raise RuntimeError(f"Project settings validation failed: {lValidator.errors}")
+        raise RuntimeError(f"Project settings validation failed: {lErrors}")
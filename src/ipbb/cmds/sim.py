@@ -7,7 +7,6 @@ import sh
 import shutil
 import getpass
 import collections
-import cerberus
 
 from copy import deepcopy
 from rich.table import Table
@@ -111,7 +110,7 @@ def find_ip_src( srcs ):
 
 
 # ------------------------------------------------------------------------------
-def sim(ictx, proj):
+def sim(ictx, proj, cmdlist=()):
     '''Simulation commands group'''
 
     if proj is not None:
@@ -125,6 +124,10 @@ def sim(ictx, proj):
             'Project area not defined. Move into a project area and try again.'
         )
 
+    # Start Vivado in the background while the dependencies are parsed and validated
+    if 'ipcores' in cmdlist and which('vivado'):
+        xilinx.VivadoConsolePool.default().prewarm(1)
+
     validate_settings(ictx)
 
     ensure_modelsim(ictx)
@@ -176,7 +179,7 @@ def setupsimlib(ictx, aXilSimLibsPath, aForce):
         )
 
         try:
-            with xilinx.VivadoSession(sid=lSessionId) as lVivadoConsole:
+            with xilinx.VivadoPooledSession(sid=lSessionId) as lVivadoConsole:
                 lVivadoConsole(
                     'compile_simlib -verbose -simulator {} -family all -language all -library all -dir {{{}}}'.format(lSimulator, lSimlibPath)
                 )
@@ -276,7 +279,7 @@ def ipcores(ictx, aXilSimLibsPath, aToScript, aToStdout):
     try:
         with (
             # Pipe commands to Vivado console
-            xilinx.VivadoSession(sid=lSessionId) if not lDryRun
+            xilinx.VivadoPooledSession(sid=lSessionId) if not lDryRun
             else SmartOpen(lScriptPath)
         ) as lVivadoConsole:
 
@@ -3,7 +3,6 @@
 import click
 import glob
 import shutil
-import cerberus
 import sh
 
 # Elements
@@ -18,7 +17,7 @@ from ..utils import ensureNoParsingErrors, ensureNoMissingFiles, logVivadoConsol
 from ..defaults import kTopEntity
 from ..generators.vitishlsproject import VitisHLSProjectGenerator
 from ..generators.hlsiprepoxci import HLSIpRepoXciGenerator
-from ..tools.xilinx import VitisHLSSession, VitisHLSConsoleError, VivadoSession, VivadoConsoleError
+from ..tools.xilinx import VitisHLSSession, VitisHLSConsoleError, VivadoSession, VivadoConsoleError, VivadoConsolePool, VivadoPooledSession
 
 
 # @device_generation = "UltraScalePlus"
@@ -72,7 +71,7 @@ def ensure_vitishls(ictx):
     return execs[0]
 
 # ------------------------------------------------------------------------------
-def vitishls(ictx, proj, verbosity):
+def vitishls(ictx, proj, verbosity, cmdlist=()):
     '''Vivado command group'''
 
     ictx.vivadoHlsEcho = (verbosity == 'all')
@@ -88,6 +87,10 @@ def vitishls(ictx, proj, verbosity):
             'Project area not defined. Move to a project area and try again'
         )
 
+    # Start Vivado in the background, to export the ip once synthesis is done
+    if 'export-ip' in cmdlist and which('vivado'):
+        VivadoConsolePool.default().prewarm(1)
+
     validate_settings(ictx)
 
     ictx.vitishls_proj_path = join(ictx.currentproj.path, ictx.currentproj.name)
@@ -322,7 +325,7 @@ def export_ip(ictx, to_component):
     lXciGen = HLSIpRepoXciGenerator(lIPCatalogDir, lXciModName, ictx.vitishls_prod_path)
 
     try:
-        with VivadoSession(sid=lSessionId) as lVivadoConsole:
+        with VivadoPooledSession(sid=lSessionId) as lVivadoConsole:
             lXciGen.write(
                 lVivadoConsole,
                 lDepFileParser.settings,
@@ -9,7 +9,6 @@ import types
 import socket
 import yaml
 import re
-import cerberus
 
 # Elements
 from os.path import join, split, exists, splitext, abspath, basename, getmtime
@@ -25,7 +24,8 @@ from ..utils import which, SmartOpen, mkdir
 from ..utils import ensureNoParsingErrors, ensureNoMissingFiles, logVivadoConsoleError, warning_notice
 
 from ..generators.vivadoproject import VivadoProjectGenerator
-from ..tools.xilinx import VivadoSession, VivadoSessionManager, VivadoConsoleError, VivadoSnoozer, VivadoProject
+from ..tools.xilinx import VivadoSession, VivadoSessionManager, VivadoConsoleError, VivadoSnoozer, VivadoProject, VivadoCommandBatch
+from ..tools.xilinx import sessionSocketPath, sessionDaemonStatus, startSessionDaemon, stopSessionDaemon, VivadoDaemonError
 from ..defaults import kTopEntity
 
 
@@ -51,6 +51,12 @@ _svfSettingName = 'svf_jtagchain_devices'
 _rum_synth = 'synth_1'
 _rum_impl = 'impl_1'
 
+# Subcommands that always open a Vivado session
+_session_cmds = {
+    'generate-project', 'check-syntax', 'synth', 'impl', 'resource-usage', 'bitfile',
+    'debug-probes', 'memcfg', 'status', 'reset-runs', 'archive', 'ipy'
+}
+
 
 
 # ------------------------------------------------------------------------------
@@ -94,7 +100,7 @@ def ensure_vivado_project_path(aProjPath: str):
         raise click.ClickException("Vivado project %s does not exist" % aProjPath)
 
 # ------------------------------------------------------------------------------
-def vivado(ictx, loglevel, cmdlist):
+def vivado(ictx, loglevel, cmdlist, framed=False):
     '''Vivado command group
     
     Args:
@@ -102,6 +108,7 @@ def vivado(ictx, loglevel, cmdlist):
         ictx (ipbb.Context): Context object
         proj (str): Project name
         loglevel (str): Verbosity level
+        framed (bool): Use framed replies in Vivado sessions
     
     Raises:
         click.ClickException: Undefined project area
@@ -119,7 +126,7 @@ def vivado(ictx, loglevel, cmdlist):
             'Project area not defined. Move to a project area and try again'
         )
     
-    validate_settings(ictx)
+    cmdlist = list(cmdlist)
 
     lKeep = True
     lLogLabel = None if not lKeep else '_'.join( cmdlist )
@@ -132,10 +139,30 @@ def vivado(ictx, loglevel, cmdlist):
     ictx.vivado_synth_dir = join(ictx.vivadoProjPath, f'{ictx.currentproj.name}', _rum_synth)
     ictx.vivado_impl_dir = join(ictx.vivadoProjPath, f'{ictx.currentproj.name}.runs', _rum_impl)
 
-    ictx.vivadoSessions = VivadoSessionManager(keep=lKeep, echo=(loglevel != 'none'), loglabel=lLogLabel, loglevel=loglevel)
-
     ensure_vivado(ictx)
 
+    # Attach to the project's session daemon, if one is running
+    ictx.vivadoFramed = framed
+    ictx.vivadoSessionSocket = sessionSocketPath(ictx.currentproj.path)
+    lAttach = None
+    if 'session' not in cmdlist:
+        lDaemonInfo = sessionDaemonStatus(ictx.vivadoSessionSocket)
+        if lDaemonInfo is None:
+            pass
+        elif lDaemonInfo.get('busy'):
+            cprint("Vivado session daemon busy with another client, starting a new Vivado instance", style='yellow')
+        else:
+            lAttach = ictx.vivadoSessionSocket
+            console.log(f"Attached to Vivado session daemon (pid {lDaemonInfo['pid']})", style='cyan')
+
+    ictx.vivadoSessions = VivadoSessionManager(keep=lKeep, echo=(loglevel != 'none'), loglabel=lLogLabel, loglevel=loglevel, framed=framed, attach=lAttach)
+
+    # Start Vivado in the background while the dependencies are parsed and validated
+    if _session_cmds.intersection(cmdlist):
+        ictx.vivadoSessions.prewarm()
+
+    validate_settings(ictx)
+
 
 
 # ------------------------------------------------------------------------------
@@ -158,21 +185,25 @@ def genproject(ictx, aEnableIPCache, aOptimise, aToScript, aToStdout):
     lVivadoIPCache = join(ictx.work.path, 'var', 'vivado-ip-cache') if aEnableIPCache else None
     lVivadoGen = VivadoProjectGenerator(ictx.currentproj, lVivadoIPCache, aOptimise)
 
-    if aToScript or aToStdout:
-        # Dry run
+    lDryRun = aToScript or aToStdout
+    if lDryRun:
         lConsoleCtx = SmartOpen(aToScript if not aToStdout else None)
     else:
         lConsoleCtx = ictx.vivadoSessions.getctx(lSessionId)
 
     try:
         with lConsoleCtx as lConsole:
+            # Ship the generated commands to Vivado in batches
+            lTarget = VivadoCommandBatch(lConsole) if not lDryRun else lConsole
             lVivadoGen.write(
-                lConsole,
+                lTarget,
                 lDepFileParser.settings,
                 lDepFileParser.packages,
                 lDepFileParser.commands,
                 lDepFileParser.libs,
             )
+            if not lDryRun:
+                lTarget.flush()
 
     except VivadoConsoleError as lExc:
         logVivadoConsoleError(lExc)
@@ -733,6 +764,52 @@ def reset(ictx):
 # ------------------------------------------------------------------------------
 
 
+# ------------------------------------------------------------------------------
+def session(ictx, action, aIdleTimeout):
+    '''Manage the detached Vivado session of the current project area'''
+
+    lSocket = ictx.vivadoSessionSocket
+
+    if action == 'start':
+        lInfo = sessionDaemonStatus(lSocket)
+        if lInfo is None:
+            cprint(f"Starting Vivado session daemon for {ictx.currentproj.name}")
+            try:
+                lInfo = startSessionDaemon(lSocket, ictx.currentproj.path, idletimeout=aIdleTimeout, framed=ictx.vivadoFramed)
+            except VivadoDaemonError as lExc:
+                cprint(lExc, style='red')
+                raise click.Abort()
+        else:
+            cprint("Vivado session daemon already running", style='yellow')
+
+    elif action == 'stop':
+        if stopSessionDaemon(lSocket):
+            console.log(f"{ictx.currentproj.name}: Vivado session daemon stopped.", style='green')
+        else:
+            cprint("No Vivado session daemon running", style='yellow')
+        return
+
+    else:
+        lInfo = sessionDaemonStatus(lSocket)
+
+    if lInfo is None:
+        cprint("No Vivado session daemon running", style='yellow')
+        return
+
+    lTable = Table("Session", "", title="Vivado session daemon")
+    lTable.add_row("socket", lSocket)
+    if lInfo.get('busy'):
+        lTable.add_row("status", "busy")
+    else:
+        lTable.add_row("status", "idle")
+        lTable.add_row("pid", str(lInfo['pid']))
+        lTable.add_row("vivado", f"{lInfo['variant']} {lInfo['version']} (pid {lInfo['vivado_pid']})")
+        lTable.add_row("started", time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(lInfo['started'])))
+        lTable.add_row("project", lInfo['project'] or '-')
+    cprint(lTable)
+# ------------------------------------------------------------------------------
+
+
 # ------------------------------------------------------------------------------
 def package(ictx, aTag):
     '''
@@ -11,6 +11,8 @@ from ..context import Context
 
 from ..depparser import DepFormatter
 from ..console import cprint, console
+from ..utils.profiler import ProfiledGroup, profileOption, enableProfiling
+from ..utils import tracing
 from .. import __version__
 
 # ------------------------------------------------------------------------------
@@ -25,15 +27,19 @@ CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'], show_default=True)
 #     intro='Starting IPBus Builder...',
 #     context_settings=CONTEXT_SETTINGS
 # )
-@click.group(cls=click_didyoumean.DYMGroup, context_settings=CONTEXT_SETTINGS)
+@click.group(cls=ProfiledGroup, context_settings=CONTEXT_SETTINGS)
 @click.option('-e', '--exception-stack', 'aExcStack', is_flag=True, help="Display full exception stack")
+@profileOption
 @click.pass_context
 @click.version_option()
-def climain(ctx, aExcStack):
+def climain(ctx, aExcStack, aProfile):
     ictx = ctx.obj
 
     ictx.printExceptionStack = aExcStack
 
+    if aProfile is not None:
+        enableProfiling(ctx, aProfile)
+
 
 # ------------------------------------------------------------------------------
 def _compose_cli():
@@ -98,6 +104,8 @@ def main():
 
     _compose_cli()
 
+    tracing.install()
+
     obj = Context()
     try:
         climain(obj=obj, show_default=True)
@@ -11,6 +11,8 @@ from rich.text import Text
 from ..console import cprint, console
 from ..utils import logVivadoConsoleError
 from ..utils import which
+from ..utils.profiler import ProfiledGroup, profileOption, enableProfiling
+from ..utils import tracing
 from ..tools.xilinx import VivadoHWServer, VivadoConsoleError
 from .. import __version__
 
@@ -45,15 +47,19 @@ def autodetectVivadoVariant():
 #     intro='Starting IPBus Builder...',
 #     context_settings=CONTEXT_SETTINGS
 # )
-@click.group(cls=click_didyoumean.DYMGroup, context_settings=CONTEXT_SETTINGS)
+@click.group(cls=ProfiledGroup, context_settings=CONTEXT_SETTINGS)
 @click.option('-e', '--exception-stack', 'aExcStack', is_flag=True, help="Display full exception stack")
+@profileOption
 @click.pass_context
 @click.version_option()
-def cli(ctx, aExcStack):
+def cli(ctx, aExcStack, aProfile):
     ictx = ctx.obj
 
     ictx.printExceptionStack = aExcStack
 
+    if aProfile is not None:
+        enableProfiling(ctx, aProfile)
+
 
 
 # ------------------------------------------------------------------------------
@@ -265,6 +271,8 @@ def program(obj, deviceid, bitfile, probe, yes):
 
 def main():
     '''Discovers the env at startup'''
+    tracing.install()
+
     obj = ProgEnvironment()
 
     try:
@@ -6,11 +6,12 @@ import cerberus
 from .. import utils
 from ..console import cprint
 
-from os import walk, getcwd
+from os import walk, getcwd, stat
 from os.path import join, split, exists, splitext, basename, dirname
 
 from ..defaults import kWorkAreaFile, kProjAreaFile, kProjUserFile, kSourceDir, kProjDir, kRepoFile, kDeprecatesSetupFile
 from ..utils.printing import deprecation_warning, error_notice
+from ..utils.validation import validate
 
 
 # TODO:
@@ -37,6 +38,12 @@ src_repo_schema = {
     }
 }
 
+# Use the C-accelerated yaml loader, when available
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Work/project area detection results, keyed by the (device, inode) pair of the search path
+_autodetect_cache = {}
+
 proj_settings_schema = {
     'name': {'type': 'string'},
     'toolset': {'type': 'string', 'allowed': ['vivado', 'vitis_hls', 'sim']},
@@ -101,7 +108,7 @@ class SourceInfo(FolderInfo):
                 return
 
         with open(repo_settings_path, 'r') as f:
-            self._repo_settings = yaml.safe_load(f)
+            self._repo_settings = yaml.load(f, Loader=_YamlLoader)
 
         self.validate_repo_settings()
 
@@ -112,16 +119,16 @@ class SourceInfo(FolderInfo):
         if not ss:
             return
 
-        vtor = cerberus.Validator(src_repo_schema)
+        lErrors = validate(src_repo_schema, ss)
 
-        if not vtor.validate(ss):
+        if lErrors:
             error_notice(f"""Source repo settings validation failed
     Detected errors: 
-       {vtor.errors}
+       {lErrors}
     in settings of {self.name}:
        {ss}
     """)
-            raise RuntimeError(f"Repository settings validation failed: {vtor.errors}")
+            raise RuntimeError(f"Repository settings validation failed: {lErrors}")
 
 
 
@@ -130,20 +137,45 @@ class ProjectInfo(FolderInfo):
     '''
     Helper class to contain project information and configuration parameters
     Provides methods to load/save configuration fragments to file.
+    Settings files are loaded lazily, on first access.
     '''
 
     # ------------------------------------------------------------------------------
     def __init__(self, aPath=None):
         self.name = None
         self.path = None
-        self.settings = {}
-        self.usersettings = {}
+        self._settings = None
+        self._usersettings = None
 
         if aPath is None:
             return
 
         self.load(aPath)
 
+    # ------------------------------------------------------------------------------
+    @property
+    def settings(self):
+        if self._settings is None:
+            self.load_settings()
+        return self._settings
+
+    # ------------------------------------------------------------------------------
+    @settings.setter
+    def settings(self, value):
+        self._settings = value
+
+    # ------------------------------------------------------------------------------
+    @property
+    def usersettings(self):
+        if self._usersettings is None:
+            self.load_user_settings()
+        return self._usersettings
+
+    # ------------------------------------------------------------------------------
+    @usersettings.setter
+    def usersettings(self, value):
+        self._usersettings = value
+
     # ------------------------------------------------------------------------------
     @property
     def filepath(self):
@@ -168,27 +200,29 @@ class ProjectInfo(FolderInfo):
             )
 
         self.name = basename(self.path)
-        self.load_settings()
-        self.load_user_settings()
+        self._settings = None
+        self._usersettings = None
 
     # ------------------------------------------------------------------------------
     def load_settings(self):
-        if not exists(self.filepath):
+        self._settings = {}
+        if not self.path or not exists(self.filepath):
             return
 
         self.name = basename(self.path)
 
         # Import project settings
         with open(self.filepath, 'r') as f:
-            self.settings = yaml.safe_load(f)
+            self._settings = yaml.load(f, Loader=_YamlLoader) or {}
 
     # ------------------------------------------------------------------------------
     def load_user_settings(self):
-        if not exists(self.userfilepath):
+        self._usersettings = {}
+        if not self.path or not exists(self.userfilepath):
             return
 
         with open(self.userfilepath, 'r') as f:
-            self.usersettings = yaml.safe_load(f)
+            self._usersettings = yaml.load(f, Loader=_YamlLoader) or {}
 
     # ------------------------------------------------------------------------------
     def save_settings(self, jsonindent=2):
@@ -206,12 +240,9 @@ class ProjectInfo(FolderInfo):
 
     # ------------------------------------------------------------------------------
     def validate_settings(self):
-        import cerberus
-        v = cerberus.Validator()
-
-        x = v.validate(self.settings, proj_settings_schema)
-        print('Proj Doc Validated', x)
-        print(v.errors)
+        lErrors = validate(proj_settings_schema, self.settings)
+        print('Proj Doc Validated', not lErrors)
+        print(lErrors)
 
     # ------------------------------------------------------------------------------
     def validateUserSettings(self):
@@ -227,10 +258,10 @@ class Context(object):
     printExceptionStack = False
 
     # ----------------------------------------------------------------------------
-    def __init__(self, wd=getcwd()):
+    def __init__(self, wd=None):
         super().__init__()
 
-        self._wd = wd
+        self._wd = wd if wd is not None else getcwd()
         self._autodetect()
 
 
@@ -246,6 +277,38 @@ class Context(object):
 
         self.pathMaker = None
 
+    # ----------------------------------------------------------------------------
+    def _findsignatures(self):
+        """
+        Locate work and project area signatures, walking up the directory tree once.
+        Results are cached by the inode of the search path and revalidated on reuse.
+        
+        Returns:
+            tuple: work area and project area paths
+        """
+        try:
+            lWdStat = stat(self._wd)
+            lKey = (lWdStat.st_dev, lWdStat.st_ino)
+        except OSError:
+            lKey = None
+
+        lCached = _autodetect_cache.get(lKey)
+        if lCached is not None:
+            # Ensure the cached signatures are still in place
+            lWorkAreaPath, lProjAreaPath = lCached
+            if (
+                (lWorkAreaPath is None or exists(join(lWorkAreaPath, kWorkAreaFile)))
+                and (lProjAreaPath is None or exists(join(lProjAreaPath, kProjAreaFile)))
+            ):
+                return lCached
+
+        lFound = utils.findSignaturesInParents([kProjAreaFile, kWorkAreaFile], self._wd, aStopAt=kWorkAreaFile)
+        lSignatures = (lFound[kWorkAreaFile], lFound[kProjAreaFile])
+
+        if lKey is not None:
+            _autodetect_cache[lKey] = lSignatures
+        return lSignatures
+
     # ----------------------------------------------------------------------------
     def _autodetect(self):
         from ..depparser import Pathmaker
@@ -253,7 +316,7 @@ class Context(object):
         self._clear()
 
         # -----------------------------
-        lWorkAreaPath = utils.findFileDirInParents(kWorkAreaFile, self._wd)
+        lWorkAreaPath, lProjAreaPath = self._findsignatures()
 
         # Stop here is no signature is found
         if not lWorkAreaPath:
@@ -265,7 +328,6 @@ class Context(object):
         self.pathMaker = Pathmaker(self.srcdir, self._verbosity)
 
         # -----------------------------
-        lProjAreaPath = utils.findFileDirInParents(kProjAreaFile, self._wd)
         if not lProjAreaPath:
             return
 
@@ -1,8 +1,7 @@
-
-import cerberus
 import argparse
 from ._cmdtypes import Command, IncludeCommand, SrcCommand, HlsSrcCommand, SetupCommand, AddrtabCommand
 from ..console import cprint, console
+from ..utils.validation import validate
 
 
 
@@ -81,13 +80,13 @@ class DepCmdParser(argparse.ArgumentParser):
 
 
     def validate_defaults(self):
-        lValidator = cerberus.Validator(cmds_defaults_schema, allow_unknown=True)
         for pkg,defs in self.package_defaults.items():
-            if not lValidator.validate(defs):
+            lErrors = validate(cmds_defaults_schema, defs, allow_unknown=True)
+            if lErrors:
                 cprint(f"ERROR: {pkg} repository settings validation failed", style='red')
-                cprint(f"   Detected errors: {lValidator.errors}", style='red')
+                cprint(f"   Detected errors: {lErrors}", style='red')
                 cprint(f"   Settings: {defs}", style='red')
-                raise RuntimeError(f"Package repo settings validation failed: {lValidator.errors}")
+                raise RuntimeError(f"Package repo settings validation failed: {lErrors}")
 
     # ---------------------------------
     def __init__(self, package_defaults : dict = {}):
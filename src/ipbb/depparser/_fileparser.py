@@ -6,7 +6,6 @@ import copy
 import string
 import re
 import shlex
-import cerberus
 
 from typing import Tuple
 
@@ -18,6 +17,7 @@ from ._cmdtypes import SrcCommand, IncludeCommand
 from ..console import cprint, console
 from ..tools.alien import AlienTree, AlienTemplate
 from ..utils.printing import error_notice
+from ..utils.validation import validate
 
 from collections import OrderedDict
 from os.path import exists, splitext, sep
@@ -142,14 +142,14 @@ class DepFileParser(object):
     @staticmethod
     def repo_settings_to_defaults(repo_settings):
 
-        vtor = cerberus.Validator(repo_defaults_schema)
         errors = {}
 
         pkg_defaults = {}
         for pkg,settings in repo_settings.items():
 
-            if not vtor.validate(settings):
-                errors[pkg] = vtor.errors
+            pkg_errors = validate(repo_defaults_schema, settings)
+            if pkg_errors:
+                errors[pkg] = pkg_errors
 
             src_cmd = {}
             if 'vhdl_standard' in settings:
@@ -2,6 +2,8 @@ from .vivado_console import *
 from .vivado_hwserver import *
 from .vivado_batch import *
 from .vivado_project import *
+from .vivado_pool import *
+from .vivado_daemon import *
 
 
 from .vitishls_console import *
@@ -88,6 +88,7 @@ class VivadoOutputFormatter(OutputFormatter):
 
         self.pendingchars = ''
         self.skiplines = ['\r\x1b[12C\r']
+        self.skipprefixes = ()
         self.loglevel = self.__log_levels[loglevel]
 
     def write(self, message):
@@ -124,6 +125,9 @@ class VivadoOutputFormatter(OutputFormatter):
             if lLine in self.skiplines:
                 continue
 
+            if self.skipprefixes and lLine.startswith(self.skipprefixes):
+                continue
+
             if self.quiet:
                 continue
 
@@ -53,6 +53,16 @@ def on_parent_exit(signame):
 
 
 
+# -------------------------------------------------------------------------
+def _tclquote(aText):
+    """
+    Quotes a string as a TCL double-quoted word, preserving it verbatim.
+    """
+    for c in '\\"$[]{}':
+        aText = aText.replace(c, '\\' + c)
+    return '"' + aText + '"'
+
+
 # -------------------------------------------------------------------------
 class VivadoConsoleError(Exception):
     """Exception raised for errors in the input.
@@ -87,6 +97,23 @@ class VivadoConsole(object):
     __reCharBackspace = re.compile(r'.\x08')
     __reError = re.compile(r'^ERROR:')
     __reCriticalWarning = re.compile(r'^CRITICAL WARNING:')
+    __reBatchMarker = re.compile(r'^@@ipbb-batch(-error)? (\d+)')
+    __reFrameEscape = re.compile(r'\\(.)')
+    __frameMarker = '@@IPBB-FRAME '
+    # TCL helper wrapping commands in catch and emitting a frame line:
+    # @@IPBB-FRAME <return code> <new errors> <new critical warnings> <length>:<escaped result>
+    __frameHelper = (
+        'namespace eval ::ipbb {}; '
+        'proc ::ipbb::run {cmd} { '
+        'set e0 [get_msg_config -count -severity ERROR]; '
+        'set w0 [get_msg_config -count -severity {CRITICAL WARNING}]; '
+        'set rc [catch {uplevel #0 $cmd} res]; '
+        'set ne [expr {[get_msg_config -count -severity ERROR] - $e0}]; '
+        'set nw [expr {[get_msg_config -count -severity {CRITICAL WARNING}] - $w0}]; '
+        r'set res [string map [list \\ \\\\ \n \\n \r \\r] $res]; '
+        'puts "@@IPBB-FRAME $rc $ne $nw [string length $res]:$res"; '
+        'return }'
+    )
     __instances = set()
     __promptMap = {
         'vivado': re.compile(r'Vivado%\s'),
@@ -120,7 +147,7 @@ class VivadoConsole(object):
     # --------------------------------------------------------------
 
     # --------------------------------------------------------------
-    def __init__(self, executable='vivado', prompt=None, stopOnCWarnings=False, echo=True, showbanner=False, sid=None, loglabel=None, loglevel='all'):
+    def __init__(self, executable='vivado', prompt=None, stopOnCWarnings=False, echo=True, showbanner=False, sid=None, loglabel=None, loglevel='all', framed=False):
         """
         Args:
             executable (str): Executable name
@@ -130,6 +157,7 @@ class VivadoConsole(object):
             showbanner (bool, optional): Show Vivado startup banner
             sid (str): Session id
             loglabel (None, optional): log files name
+            framed (bool, optional): Exchange commands results as frames, rather than scraping the output
         
         Raises:
             VivadoNotFoundError: Description
@@ -199,6 +227,10 @@ class VivadoConsole(object):
         # Add self to the list of instances
         self.__instances.add(self)
 
+        self._framed = False
+        if framed:
+            self.__enableFrames()
+
     # --------------------------------------------------------------
     @property
     def variant(self):
@@ -219,6 +251,29 @@ class VivadoConsole(object):
     def stopOnCWarnings(self, stop):
         self._stopOnCWarnings = stop
 
+    # --------------------------------------------------------------
+    @property
+    def framed(self):
+        return self._framed
+
+    # --------------------------------------------------------------
+    def __enableFrames(self):
+        """
+        Injects the framing helper. Output scraping remains in use if it fails.
+        """
+        lQuiet = self._out.quiet
+        self._out.quiet = True
+        try:
+            self.execute(self.__frameHelper)
+            self._framed = True
+        except VivadoConsoleError:
+            self._log.warning('Failed to set up framed results, falling back to output scraping')
+        finally:
+            self._out.quiet = lQuiet
+
+        if self._framed:
+            self._out.skipprefixes = (self.__frameMarker,)
+
     # --------------------------------------------------------------
     @property
     def sessionid(self):
@@ -342,6 +397,7 @@ class VivadoConsole(object):
             return
 
         self._log.debug('Shutting Vivado down')
+        self._framed = False
         try:
             self.execute('quit')
         except pexpect.ExceptionPexpect:
@@ -365,6 +421,9 @@ class VivadoConsole(object):
         if aCmd.count('\n') != 0:
             raise ValueError('Format error. Newline not allowed in commands')
 
+        if self._framed:
+            return self.__executeFramed(aCmd, aMaxLen)
+
         self.__send(aCmd)
         lBuffer, lErrors, lCriticalWarnings = self.__expectPrompt(aMaxLen)
 
@@ -373,6 +432,146 @@ class VivadoConsole(object):
 
         return tuple(lBuffer)
 
+    # --------------------------------------------------------------
+    def __executeFramed(self, aCmd, aMaxLen):
+        """
+        Executes a command through the framing helper.
+
+        Errors and critical warnings are detected from the message counters
+        reported in the frame; the output is only scanned when reporting them.
+        """
+        self._process.sendline(f'::ipbb::run {_tclquote(aCmd)}')
+
+        lTimeoutCounts = 0
+        while self._process.expect_exact([self.__frameMarker, pexpect.TIMEOUT]) != 0:
+            lTimeoutCounts += 1
+            print ("VivadoConsole >> Time since last command: {0}s".format(
+                lTimeoutCounts * self._process.timeout))
+
+        # Drop the command echo
+        lOutput = [l.rstrip('\r') for l in self._process.before.split('\r\n')[1:-1]]
+
+        self._process.expect_exact(':')
+        lCode, lNumErrors, lNumCWarnings, lLength = (int(x) for x in self._process.before.split())
+
+        # Carriage returns in the result are escaped, any left belong to the line termination
+        self._process.expect_exact('\r\n')
+        lResult = self._process.before.rstrip('\r')
+
+        self._process.expect(self._prompt)
+
+        if len(lResult) != lLength:
+            raise RuntimeError(f"Malformed result frame: expected {lLength} characters, received {len(lResult)}")
+        if '\\' in lResult:
+            lResult = self.__reFrameEscape.sub(lambda m: {'n': '\n', 'r': '\r'}.get(m.group(1), m.group(1)), lResult)
+
+        if lCode == 1 or lNumErrors or (self._stopOnCWarnings and lNumCWarnings):
+            lErrors = [l for l in lOutput if self.__reError.match(l)]
+            lCriticalWarnings = [l for l in lOutput if self.__reCriticalWarning.match(l)]
+            if lCode == 1 and not lErrors:
+                lErrors.append('ERROR: ' + lResult)
+            raise VivadoConsoleError(aCmd, lErrors, lCriticalWarnings)
+
+        lBuffer = collections.deque(lOutput, aMaxLen)
+        if lResult:
+            lBuffer.extend(lResult.split('\n'))
+        if not lBuffer:
+            lBuffer.append(None)
+
+        return tuple(lBuffer)
+
+    # --------------------------------------------------------------
+    def __expectBatch(self, aNumCmds, aMaxLen):
+
+        lBuffers = [collections.deque([], aMaxLen) for _ in range(aNumCmds)]
+        lErrors = [[] for _ in range(aNumCmds)]
+        lCriticalWarnings = [[] for _ in range(aNumCmds)]
+        lFailed = None
+
+        # Output preceding the first marker is attributed to the first command
+        lCurrent = 0
+        lTimeoutCounts = 0
+        while True:
+            lIndex = self._process.expect_list(self._rePrompt)
+
+            if lIndex == 1:
+                break
+            elif lIndex == 2:
+                lTimeoutCounts += 1
+                print ("VivadoConsole >> Time since last command: {0}s".format(
+                    lTimeoutCounts * self._process.timeout))
+
+            lBefore = str(self._process.before)
+
+            if lBefore.startswith('@@ipbb-batch'):
+                m = self.__reBatchMarker.match(lBefore)
+                if m:
+                    lCurrent = int(m.group(2))
+                    if m.group(1):
+                        lFailed = lCurrent
+                    continue
+
+            lBuffers[lCurrent].append(lBefore)
+
+            if self.__reError.match(lBefore):
+                lErrors[lCurrent].append(lBefore)
+            elif self.__reCriticalWarning.match(lBefore):
+                lCriticalWarnings[lCurrent].append(lBefore)
+
+        return lBuffers, lErrors, lCriticalWarnings, lFailed
+
+    # --------------------------------------------------------------
+    def execute_batch(self, aCmds, aMaxLen=1):
+        """Execute a sequence of commands in a single round-trip.
+
+        The commands are written to a temporary script, sourced by Vivado.
+        Each command is preceded by a marker line, used to attribute output,
+        errors and critical warnings back to it. The script stops at the
+        first command raising a TCL error.
+
+        Args:
+            aCmds (list): Commands to execute
+            aMaxLen (int, optional): Number of output lines to return per command
+
+        Returns:
+            list: Output lines of each command, as returned by execute
+
+        Raises:
+            VivadoConsoleError: Raised for the first command reporting errors
+                (or critical warnings, if stopOnCWarnings is set)
+        """
+        lCmds = list(aCmds)
+        for lCmd in lCmds:
+            if not isinstance(lCmd, str):
+                raise TypeError('expected string, found '+str(type(lCmd)))
+            if lCmd.count('\n') != 0:
+                raise ValueError('Format error. Newline not allowed in commands')
+
+        if not lCmds:
+            return []
+
+        with tempfile.NamedTemporaryFile('w', prefix='ipbb_batch_', suffix='.tcl', delete=False) as lScript:
+            for i, lCmd in enumerate(lCmds):
+                lQuoted = _tclquote(lCmd)
+                lScript.write(
+                    f'puts "@@ipbb-batch {i}: {lQuoted[1:-1]}"\n'
+                    f'set __ipbb_rc [catch {lQuoted} __ipbb_res]\n'
+                    f'if {{$__ipbb_rc == 1}} {{puts "@@ipbb-batch-error {i}"; return -code error $__ipbb_res}}\n'
+                    f'if {{$__ipbb_res ne ""}} {{puts $__ipbb_res}}\n'
+                )
+
+        try:
+            self.__send(f'source -notrace {{{lScript.name}}}')
+            lBuffers, lErrors, lCriticalWarnings, lFailed = self.__expectBatch(len(lCmds), aMaxLen)
+        finally:
+            os.remove(lScript.name)
+
+        for i, lCmd in enumerate(lCmds):
+            if lErrors[i] or i == lFailed or (self._stopOnCWarnings and lCriticalWarnings[i]):
+                raise VivadoConsoleError(lCmd, lErrors[i] or list(lBuffers[i]), lCriticalWarnings[i])
+
+        return [tuple(b) if b else (None,) for b in lBuffers]
+
     # --------------------------------------------------------------
     def changeMsgSeverity(self, aIds, aSeverity):
         """Change the severity of a single/multiple messages
@@ -386,6 +585,49 @@ class VivadoConsole(object):
             self.execute(c)
 
 
+# -------------------------------------------------------------------------
+class VivadoCommandBatch(object):
+    """
+    Console-like target collecting commands and executing them in batches.
+
+    Commands are flushed when the batch is full and when leaving the with
+    block. Command outputs are not returned.
+
+    Attributes:
+        console (VivadoConsole): Target console
+        size (int): Maximum number of commands per batch
+    """
+
+    # --------------------------------------------------------------
+    def __init__(self, aConsole, aSize=1000):
+        super().__init__()
+        self.console = aConsole
+        self.size = aSize
+        self._cmds = []
+
+    # --------------------------------------------------------------
+    def __enter__(self):
+        return self
+
+    # --------------------------------------------------------------
+    def __exit__(self, type, value, traceback):
+        if type is None:
+            self.flush()
+
+    # --------------------------------------------------------------
+    def __call__(self, aCmd='', aMaxLen=1):
+        if not aCmd:
+            return
+        self._cmds.append(aCmd)
+        if len(self._cmds) >= self.size:
+            self.flush()
+
+    # --------------------------------------------------------------
+    def flush(self):
+        lCmds, self._cmds = self._cmds, []
+        self.console.execute_batch(lCmds)
+
+
 #-------------------------------------------------------------------------------
 @consolectxmanager
 class VivadoSession(VivadoConsole):
@@ -437,33 +679,55 @@ class VivadoSessionManager(object):
     Attributes:
         persistent (TYPE): Description
     """
-    def __init__(self, keep=False, echo=True, loglabel=None, loglevel='all'):
+    def __init__(self, keep=False, echo=True, loglabel=None, loglevel='all', framed=False, attach=None):
         """Constructor
         
         Args:
             keep (TYPE): Description
+            framed (bool): Use framed results in the Vivado consoles
+            attach (str, optional): Socket of a session daemon to attach to, instead of starting Vivado
         """
         super().__init__()
         self._keep = keep
         self._echo = echo
         self._loglabel = loglabel
         self._loglevel = loglevel
+        self._framed = framed
+        self._attach = attach
         if self._keep:
             self._console = None
 
+        from .vivado_pool import VivadoConsolePool
+        self._pool = VivadoConsolePool(size=1, loglabel=loglabel, echo=echo, loglevel=loglevel, framed=framed)
+
     def __del__(self):
         if self._keep and self._console:
             self._console.close()
 
+    def prewarm(self):
+        """Starts the Vivado console in the background, ahead of the first session.
+        """
+        if not self._attach:
+            self._pool.prewarm()
+
     def _getconsole(self, sid):
 
+        if self._attach:
+            from .vivado_daemon import VivadoConsoleProxy
+            if not self._keep:
+                return VivadoConsoleProxy(self._attach, sid=sid, echo=self._echo, loglevel=self._loglevel)
+            if not self._console:
+                self._console = VivadoConsoleProxy(self._attach, sid=sid, echo=self._echo, loglevel=self._loglevel)
+            self._console.sessionid = sid
+            return self._console
+
         if self._keep:
             if not self._console:
-                self._console = VivadoConsole(sid=sid, loglabel=self._loglabel, echo=self._echo, loglevel=self._loglevel)
+                self._console = self._pool.acquire(sid=sid)
             self._console.sessionid = sid
             return self._console
         else:
-            return VivadoConsole(sid=sid, loglabel=self._loglabel, echo=self._echo, loglevel=self._loglevel)
+            return self._pool.acquire(sid=sid)
 
 
     def getctx(self, sid):
@@ -0,0 +1,523 @@
+
+# Modules
+import os
+import sys
+import json
+import time
+import socket
+import hashlib
+import logging
+import argparse
+import tempfile
+import subprocess
+
+from os.path import join, abspath, exists
+
+from .vivado_common import VivadoOutputFormatter
+from .vivado_console import VivadoConsole, VivadoConsoleError
+
+
+# -------------------------------------------------------------------------
+class VivadoDaemonError(RuntimeError):
+    """Exception raised when the session daemon cannot be reached or started
+    """
+    pass
+
+
+# -------------------------------------------------------------------------
+class VivadoDaemonBusyError(VivadoDaemonError):
+    """Exception raised when the session daemon is serving another client
+    """
+    pass
+
+
+# -------------------------------------------------------------------------
+def sessionSocketPath(aProjPath):
+    """
+    Socket path of the session daemon serving a project area.
+
+    Sockets are kept in the user runtime directory rather than in the project
+    area, as unix socket paths are limited to ~100 characters.
+
+    Args:
+        aProjPath (str): Project area path
+
+    Returns:
+        str: Socket path
+    """
+    lRuntimeDir = os.environ.get('XDG_RUNTIME_DIR') or join(tempfile.gettempdir(), f'ipbb-{os.getuid()}')
+    os.makedirs(lRuntimeDir, mode=0o700, exist_ok=True)
+    lHash = hashlib.sha1(abspath(aProjPath).encode()).hexdigest()[:16]
+    return join(lRuntimeDir, f'ipbb-vivado-{lHash}.sock')
+
+
+# -------------------------------------------------------------------------
+class _Channel(object):
+    """Newline-delimited json messages over a stream socket
+    """
+
+    def __init__(self, aSocket):
+        self._sock = aSocket
+        self._file = aSocket.makefile('r', encoding='utf-8', newline='\n')
+
+    def send(self, aMsg):
+        self._sock.sendall((json.dumps(aMsg) + '\n').encode('utf-8'))
+
+    def recv(self):
+        lLine = self._file.readline()
+        if not lLine:
+            return None
+        return json.loads(lLine)
+
+    def close(self):
+        self._file.close()
+        self._sock.close()
+
+
+# -------------------------------------------------------------------------
+class _OutputRelay(object):
+    """pexpect logfile forwarding Vivado's output to the attached client
+    """
+
+    def __init__(self, aOut):
+        self._out = aOut
+        self.channel = None
+
+    def write(self, aMessage):
+        self._out.write(aMessage)
+        if self.channel is None:
+            return
+        try:
+            self.channel.send({'out': aMessage})
+        except OSError:
+            # The client went away, the command is run to completion nonetheless
+            self.channel = None
+
+    def flush(self):
+        self._out.flush()
+
+
+# -------------------------------------------------------------------------
+class VivadoSessionDaemon(object):
+    """Detached Vivado console, served over a unix socket
+
+    Clients are served one at a time: a client attaches for the duration of
+    an ipbb invocation, the next one is accepted when it disconnects.
+
+    Attributes:
+        path (str): Socket path
+        idletimeout (float): Time without clients after which the daemon exits, in seconds. 0 for no timeout
+    """
+
+    # --------------------------------------------------------------
+    def __init__(self, aSocketPath, idletimeout=0, **kwargs):
+        """
+        Args:
+            aSocketPath (str): Socket path
+            idletimeout (float, optional): Idle time after which the daemon exits
+            **kwargs: VivadoConsole arguments
+        """
+        super().__init__()
+        self._log = logging.getLogger('VivadoDaemon')
+        self.path = aSocketPath
+        self.idletimeout = idletimeout
+        self._kwargs = kwargs
+        self._console = None
+        self._relay = None
+        self._started = None
+        self._running = False
+
+    # --------------------------------------------------------------
+    def info(self):
+        lProject = self._console('current_project -quiet')[0]
+        return {
+            'pid': os.getpid(),
+            'vivado_pid': self._console.processinfo.pid,
+            'variant': self._console.variant,
+            'version': self._console.version,
+            'framed': self._console.framed,
+            'skipprefixes': list(self._console._out.skipprefixes),
+            'cwd': os.getcwd(),
+            'started': self._started,
+            'project': lProject,
+        }
+
+    # --------------------------------------------------------------
+    def _handle(self, aRequest):
+        lOp = aRequest.get('op')
+        if lOp == 'ping':
+            return {'result': True}
+        elif lOp == 'info':
+            return {'result': self.info()}
+        elif lOp == 'shutdown':
+            self._running = False
+            return {'result': True}
+        elif lOp not in ('execute', 'batch'):
+            return {'exception': 'ValueError', 'message': f'Unknown operation {lOp}'}
+
+        self._console.sessionid = aRequest.get('sid')
+        self._console.stopOnCWarnings = aRequest.get('cwarn', False)
+        try:
+            if lOp == 'execute':
+                return {'result': list(self._console.execute(aRequest['cmd'], aRequest.get('maxlen', 1)))}
+            else:
+                return {'result': [list(r) for r in self._console.execute_batch(aRequest['cmds'], aRequest.get('maxlen', 1))]}
+        except VivadoConsoleError as lExc:
+            return {'error': {'command': lExc.command, 'errors': lExc.errors, 'criticalWarns': lExc.criticalWarns}}
+        except (TypeError, ValueError, RuntimeError) as lExc:
+            return {'exception': type(lExc).__name__, 'message': str(lExc)}
+
+    # --------------------------------------------------------------
+    def _serveClient(self, aChannel):
+        self._relay.channel = aChannel
+        try:
+            while self._running:
+                lRequest = aChannel.recv()
+                if lRequest is None:
+                    break
+                lReply = self._handle(lRequest)
+                if not self._console.isAlive():
+                    self._running = False
+                self._relay.channel = aChannel
+                aChannel.send(lReply)
+        except OSError:
+            self._log.debug('Client connection lost')
+        finally:
+            self._relay.channel = None
+            aChannel.close()
+
+    # --------------------------------------------------------------
+    def serve(self):
+        """Starts Vivado and serves clients until shut down.
+        """
+        self._console = VivadoConsole(**self._kwargs)
+        self._relay = _OutputRelay(self._console._process.logfile)
+        self._console._process.logfile = self._relay
+        self._started = time.time()
+        self._running = True
+
+        # Only accept clients once Vivado is up
+        if exists(self.path):
+            os.remove(self.path)
+
+        lServer = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        lServer.bind(self.path)
+        lServer.listen(8)
+        if self.idletimeout:
+            lServer.settimeout(self.idletimeout)
+
+        try:
+            while self._running:
+                try:
+                    lConn, _ = lServer.accept()
+                except socket.timeout:
+                    self._log.info('No clients for %ss, shutting down', self.idletimeout)
+                    break
+                lConn.settimeout(None)
+                self._serveClient(_Channel(lConn))
+        finally:
+            lServer.close()
+            if exists(self.path):
+                os.remove(self.path)
+            self._console.close()
+
+
+# -------------------------------------------------------------------------
+class VivadoConsoleProxy(object):
+    """Client side of the session daemon, with the VivadoConsole interface
+
+    Closing the proxy detaches from the daemon, which keeps Vivado running.
+    """
+
+    # --------------------------------------------------------------
+    def __init__(self, aSocketPath, sid=None, echo=True, loglevel='all', stopOnCWarnings=False, timeout=None):
+        """
+        Args:
+            aSocketPath (str): Daemon socket path
+            sid (str, optional): Session id
+            echo (bool, optional): Show Vivado's output
+            loglevel (str, optional): Vivado output log level
+            stopOnCWarnings (bool, optional): Stop on Critical Warnings
+            timeout (float, optional): Time allowed for the daemon to accept the connection
+
+        Raises:
+            VivadoDaemonError: The daemon is not running
+            VivadoDaemonBusyError: The daemon did not accept the connection in time
+        """
+        super().__init__()
+        self._stopOnCWarnings = stopOnCWarnings
+
+        lSock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        lSock.settimeout(timeout)
+        try:
+            lSock.connect(aSocketPath)
+        except OSError as lExc:
+            lSock.close()
+            raise VivadoDaemonError(f'No Vivado session daemon at {aSocketPath}: {lExc}')
+        self._channel = _Channel(lSock)
+
+        self._out = VivadoOutputFormatter(sid, loglevel=loglevel)
+        self._out.quiet = (not echo)
+
+        # The daemon replies once done with the clients attached before this one
+        try:
+            self._info = self.__request({'op': 'info'})
+        except VivadoDaemonError:
+            self.close()
+            raise
+        lSock.settimeout(None)
+        self._out.skipprefixes = tuple(self._info['skipprefixes'])
+
+    # --------------------------------------------------------------
+    def __request(self, aRequest):
+        if self._channel is None:
+            raise VivadoDaemonError('Detached from the Vivado session daemon')
+
+        try:
+            self._channel.send(aRequest)
+            while True:
+                lReply = self._channel.recv()
+                if lReply is None:
+                    raise VivadoDaemonError('Connection to the Vivado session daemon lost')
+                if 'out' in lReply:
+                    self._out.write(lReply['out'])
+                    continue
+                break
+        except socket.timeout:
+            raise VivadoDaemonBusyError('Vivado session daemon busy with another client')
+        except OSError as lExc:
+            raise VivadoDaemonError(f'Connection to the Vivado session daemon lost: {lExc}')
+
+        if 'error' in lReply:
+            lError = lReply['error']
+            raise VivadoConsoleError(lError['command'], lError['errors'], lError['criticalWarns'])
+        elif 'exception' in lReply:
+            lExcType = {'TypeError': TypeError, 'ValueError': ValueError}.get(lReply['exception'], RuntimeError)
+            raise lExcType(lReply['message'])
+
+        return lReply['result']
+
+    # --------------------------------------------------------------
+    @property
+    def quiet(self):
+        return self._out.quiet
+
+    @quiet.setter
+    def quiet(self, value):
+        self._out.quiet = value
+
+    # --------------------------------------------------------------
+    @property
+    def variant(self):
+        return self._info['variant']
+
+    # --------------------------------------------------------------
+    @property
+    def version(self):
+        return self._info['version']
+
+    # --------------------------------------------------------------
+    @property
+    def framed(self):
+        return self._info['framed']
+
+    # --------------------------------------------------------------
+    @property
+    def stopOnCWarnings(self):
+        return self._stopOnCWarnings
+
+    @stopOnCWarnings.setter
+    def stopOnCWarnings(self, stop):
+        self._stopOnCWarnings = stop
+
+    # --------------------------------------------------------------
+    @property
+    def sessionid(self):
+        return self._out.prefix
+
+    @sessionid.setter
+    def sessionid(self, prefix):
+        self._out.prefix = prefix
+
+    # --------------------------------------------------------------
+    def isAlive(self):
+        return self._channel is not None
+
+    # --------------------------------------------------------------
+    def __call__(self, aCmd='', aMaxLen=1):
+        return self.execute(aCmd, aMaxLen)
+
+    # --------------------------------------------------------------
+    def execute(self, aCmd, aMaxLen=1):
+        lResult = self.__request({'op': 'execute', 'cmd': aCmd, 'maxlen': aMaxLen, 'sid': self.sessionid, 'cwarn': self._stopOnCWarnings})
+        return tuple(lResult)
+
+    # --------------------------------------------------------------
+    def execute_batch(self, aCmds, aMaxLen=1):
+        lResult = self.__request({'op': 'batch', 'cmds': list(aCmds), 'maxlen': aMaxLen, 'sid': self.sessionid, 'cwarn': self._stopOnCWarnings})
+        return [tuple(r) for r in lResult]
+
+    # --------------------------------------------------------------
+    def changeMsgSeverity(self, aIds, aSeverity):
+        """Change the severity of a single/multiple messages
+
+        Args:
+            aIds (str or list): List of message ids to update
+            aSeverity (str): Target severity
+        """
+        lIds = aIds if isinstance(aIds, list) else [aIds]
+        for c in ('reset_msg_config -id {{{}}} -default_severity; set_msg_config -id {{{}}} -new_severity {{{}}}'.format(i, i, aSeverity) for i in lIds):
+            self.execute(c)
+
+    # --------------------------------------------------------------
+    def info(self):
+        return self.__request({'op': 'info'})
+
+    # --------------------------------------------------------------
+    def shutdown(self):
+        """Stops the daemon and its Vivado process
+        """
+        self.__request({'op': 'shutdown'})
+        self.close()
+
+    # --------------------------------------------------------------
+    def close(self):
+        """Detaches from the daemon
+        """
+        if self._channel is not None:
+            self._channel.close()
+            self._channel = None
+
+    # --------------------------------------------------------------
+    def __del__(self):
+        if hasattr(self, '_channel'):
+            self.close()
+
+
+# -------------------------------------------------------------------------
+def sessionDaemonStatus(aSocketPath):
+    """
+    Queries the session daemon.
+
+    Args:
+        aSocketPath (str): Daemon socket path
+
+    Returns:
+        dict: Daemon information, None if no daemon is running.
+            Only {'busy': True} if the daemon is serving another client
+    """
+    if not exists(aSocketPath):
+        return None
+
+    try:
+        lProxy = VivadoConsoleProxy(aSocketPath, echo=False, timeout=5.)
+    except VivadoDaemonBusyError:
+        return {'busy': True}
+    except VivadoDaemonError:
+        # Stale socket, left behind by a daemon that did not shut down cleanly
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as lSock:
+            try:
+                lSock.connect(aSocketPath)
+            except ConnectionRefusedError:
+                os.remove(aSocketPath)
+            except OSError:
+                pass
+        return None
+
+    try:
+        return lProxy._info
+    finally:
+        lProxy.close()
+
+
+# -------------------------------------------------------------------------
+def startSessionDaemon(aSocketPath, aWorkDir, aLogName='vivado_session', aTimeout=300., idletimeout=0, framed=False):
+    """
+    Starts a detached session daemon and waits for Vivado to be ready.
+
+    Args:
+        aSocketPath (str): Daemon socket path
+        aWorkDir (str): Working directory of the daemon and Vivado
+        aLogName (str, optional): Daemon and Vivado log files name
+        aTimeout (float, optional): Time allowed for Vivado to start, in seconds
+        idletimeout (float, optional): Time without clients after which the daemon exits
+        framed (bool, optional): Use framed results in the Vivado console
+
+    Returns:
+        dict: Daemon information
+
+    Raises:
+        VivadoDaemonError: The daemon failed to start
+    """
+    lArgs = [
+        sys.executable, '-m', __name__, aSocketPath,
+        '--loglabel', aLogName,
+        '--idle-timeout', str(idletimeout),
+    ]
+    if framed:
+        lArgs.append('--framed')
+
+    lLogPath = join(aWorkDir, aLogName + '_daemon.log')
+    with open(lLogPath, 'ab') as lLog:
+        lProcess = subprocess.Popen(
+            lArgs,
+            cwd=aWorkDir,
+            stdin=subprocess.DEVNULL,
+            stdout=lLog,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+            close_fds=True,
+        )
+
+    lDeadline = time.time() + aTimeout
+    while time.time() < lDeadline:
+        if lProcess.poll() is not None:
+            raise VivadoDaemonError(f'Vivado session daemon exited with code {lProcess.returncode}, see {lLogPath}')
+        lInfo = sessionDaemonStatus(aSocketPath)
+        if lInfo is not None:
+            return lInfo
+        time.sleep(0.2)
+
+    lProcess.terminate()
+    raise VivadoDaemonError(f'Vivado session daemon did not start within {aTimeout}s, see {lLogPath}')
+
+
+# -------------------------------------------------------------------------
+def stopSessionDaemon(aSocketPath):
+    """
+    Stops the session daemon, if running.
+
+    Args:
+        aSocketPath (str): Daemon socket path
+
+    Returns:
+        bool: True if a daemon was stopped
+    """
+    if sessionDaemonStatus(aSocketPath) is None:
+        return False
+
+    # Waits for other clients to detach
+    VivadoConsoleProxy(aSocketPath, echo=False).shutdown()
+    return True
+
+
+# -------------------------------------------------------------------------
+def main():
+    lParser = argparse.ArgumentParser(description='Detached Vivado session daemon')
+    lParser.add_argument('socket', help='Socket path')
+    lParser.add_argument('--loglabel', default='session', help='Vivado log files label')
+    lParser.add_argument('--idle-timeout', type=float, default=0, help='Exit after this many seconds without clients')
+    lParser.add_argument('--framed', action='store_true', help='Use framed results')
+    lArgs = lParser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    VivadoSessionDaemon(
+        lArgs.socket,
+        idletimeout=lArgs.idle_timeout,
+        loglabel=lArgs.loglabel,
+        framed=lArgs.framed,
+    ).serve()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,259 @@
+
+# Modules
+import os
+import time
+import queue
+import logging
+import threading
+import pexpect
+
+from ...utils import availableJobSlots
+from .vivado_console import VivadoConsole, VivadoConsoleError
+
+
+# -------------------------------------------------------------------------
+def defaultPoolSize():
+    """
+    Default number of pooled Vivado consoles.
+
+    Taken from IPBB_VIVADO_POOL_SIZE if defined, otherwise derived from the
+    available cores and memory (2GB per idle Vivado), up to 4.
+    """
+    lSize = os.environ.get('IPBB_VIVADO_POOL_SIZE')
+    if lSize:
+        return max(1, int(lSize))
+    return availableJobSlots(2 * 2**30, 4)
+
+
+# -------------------------------------------------------------------------
+class VivadoConsolePool(object):
+    """Pool of pre-started Vivado consoles
+
+    Consoles are started by a dedicated, long-lived thread: Vivado processes
+    are bound to the lifetime of the thread that spawned them (PR_SET_PDEATHSIG).
+    The same thread closes consoles that have been idle for too long.
+
+    Attributes:
+        size (int): Maximum number of consoles started ahead of requests
+        idletimeout (float): Time after which idle consoles are closed, in seconds
+    """
+
+    _default = None
+
+    # --------------------------------------------------------------
+    @classmethod
+    def default(cls):
+        """Returns the process-wide pool, with default console settings
+        """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    # --------------------------------------------------------------
+    def __init__(self, size=None, idletimeout=600., **kwargs):
+        """
+        Args:
+            size (int, optional): Pool size. Defaults to defaultPoolSize()
+            idletimeout (float, optional): Idle time after which a console is closed
+            **kwargs: VivadoConsole arguments
+        """
+        super().__init__()
+        self._log = logging.getLogger('VivadoPool')
+
+        self.size = size if size is not None else defaultPoolSize()
+        self.idletimeout = idletimeout
+        self._kwargs = kwargs
+
+        self._cond = threading.Condition()
+        self._requests = queue.Queue()
+        self._idle = []
+        self._busy = set()
+        self._pending = 0
+        self._waiting = 0
+        self._errors = []
+        self._spawned = 0
+        self._thread = None
+
+    # --------------------------------------------------------------
+    def _ensureThread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='vivado-pool', daemon=True)
+            self._thread.start()
+
+    # --------------------------------------------------------------
+    def _run(self):
+        while True:
+            try:
+                lRequest = self._requests.get(timeout=min(self.idletimeout, 60.))
+            except queue.Empty:
+                self.reap()
+                continue
+
+            if lRequest is None:
+                break
+
+            lConsole, lError = None, None
+            try:
+                lConsole = VivadoConsole(**lRequest)
+            except Exception as lExc:
+                lError = lExc
+
+            with self._cond:
+                self._pending -= 1
+                if lConsole is not None:
+                    self._idle.append((lConsole, time.time()))
+                else:
+                    self._errors.append(lError)
+                self._cond.notify_all()
+
+    # --------------------------------------------------------------
+    def _spawn(self):
+        """Queues the start of a new console. Must be called with the lock held.
+        """
+        lKwargs = dict(self._kwargs)
+        lLabel = lKwargs.get('loglabel')
+        if lLabel is None:
+            lKwargs['loglabel'] = f'pool{self._spawned}'
+        elif self._spawned:
+            lKwargs['loglabel'] = f'{lLabel}_{self._spawned}'
+
+        self._spawned += 1
+        self._pending += 1
+        self._ensureThread()
+        self._requests.put(lKwargs)
+
+    # --------------------------------------------------------------
+    def prewarm(self, aCount=None):
+        """Starts consoles in the background, up to aCount idle or starting ones.
+
+        Args:
+            aCount (int, optional): Number of consoles. Defaults to the pool size
+        """
+        lCount = min(self.size, aCount if aCount is not None else self.size)
+        with self._cond:
+            for _ in range(lCount - len(self._idle) - self._pending):
+                self._spawn()
+
+    # --------------------------------------------------------------
+    def acquire(self, sid=None):
+        """Hands out a running console, starting one if none is available.
+
+        Args:
+            sid (str, optional): Session id
+
+        Returns:
+            VivadoConsole: the console
+        """
+        with self._cond:
+            self._waiting += 1
+            try:
+                while True:
+                    while self._idle:
+                        lConsole, _ = self._idle.pop()
+                        if lConsole.isAlive():
+                            lConsole.sessionid = sid
+                            self._busy.add(lConsole)
+                            return lConsole
+                        self._log.debug('Discarding dead Vivado console')
+                        lConsole.close()
+
+                    if self._errors:
+                        raise self._errors.pop(0)
+
+                    if self._pending < self._waiting:
+                        self._spawn()
+
+                    self._cond.wait()
+            finally:
+                self._waiting -= 1
+
+    # --------------------------------------------------------------
+    def release(self, aConsole):
+        """Returns a console to the pool, after resetting its state.
+
+        Args:
+            aConsole (VivadoConsole): Console to return
+        """
+        with self._cond:
+            self._busy.discard(aConsole)
+
+        if not aConsole.isAlive():
+            return
+
+        try:
+            aConsole.stopOnCWarnings = False
+            aConsole.execute('close_project -quiet')
+            aConsole.execute('reset_msg_config -quiet -id * -default_severity')
+        except (VivadoConsoleError, pexpect.ExceptionPexpect, RuntimeError):
+            self._log.debug('Failed to reset Vivado console')
+            aConsole.close()
+            return
+
+        aConsole.sessionid = None
+        with self._cond:
+            self._idle.append((aConsole, time.time()))
+            self._cond.notify_all()
+
+    # --------------------------------------------------------------
+    def reap(self):
+        """Closes dead consoles and consoles idle for longer than idletimeout.
+        """
+        lNow = time.time()
+        with self._cond:
+            lExpired = [c for c, t in self._idle if not c.isAlive() or lNow - t > self.idletimeout]
+            self._idle = [(c, t) for c, t in self._idle if c not in lExpired]
+
+        for lConsole in lExpired:
+            lConsole.close()
+
+    # --------------------------------------------------------------
+    def close(self):
+        """Closes all consoles and stops the pool thread.
+        """
+        with self._cond:
+            lConsoles = [c for c, _ in self._idle] + list(self._busy)
+            self._idle = []
+            self._busy = set()
+
+        for lConsole in lConsoles:
+            lConsole.close()
+
+        if self._thread is not None:
+            self._requests.put(None)
+            self._thread.join()
+            self._thread = None
+
+    # --------------------------------------------------------------
+    def __len__(self):
+        with self._cond:
+            return len(self._idle) + len(self._busy)
+
+
+# -------------------------------------------------------------------------
+class VivadoPooledSession(object):
+    """
+    Context manager borrowing a console from a pool
+
+    with VivadoPooledSession(sid='ipcores') as console:
+        ...
+    """
+
+    # --------------------------------------------------------------
+    def __init__(self, sid=None, pool=None):
+        super().__init__()
+        self._sid = sid
+        self._pool = pool
+        self._console = None
+
+    # --------------------------------------------------------------
+    def __enter__(self):
+        if self._pool is None:
+            self._pool = VivadoConsolePool.default()
+        self._console = self._pool.acquire(sid=self._sid)
+        return self._console
+
+    # --------------------------------------------------------------
+    def __exit__(self, type, value, traceback):
+        if self._console:
+            self._pool.release(self._console)
+            self._console = None
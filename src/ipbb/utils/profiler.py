@@ -0,0 +1,177 @@
+import sys
+import time
+import threading
+import collections
+
+import click
+import click_didyoumean
+
+from os.path import basename, splitext, abspath
+
+from ..console import cprint
+
+kProfileOption = '--profile'
+
+
+# ------------------------------------------------------------------------------
+class CommandProfiler(object):
+    """
+    Deterministic (cProfile) and statistical profiler for a command chain.
+
+    cProfile only accounts for cpu time spent in python code. A sampling thread
+    complements it by recording the main thread stack at regular wall-clock
+    intervals, so that time spent blocked on Vivado or ModelSim prompts shows up
+    in the collapsed-stack (flamegraph) output.
+
+    Attributes:
+        interval (float): Sampling interval in seconds
+        samples (collections.Counter): Collapsed stacks sample counts
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, aInterval=0.005):
+        self.interval = aInterval
+        self.samples = collections.Counter()
+        self._profile = None
+        self._sampler = None
+        self._stop = threading.Event()
+        self._target = None
+        self._t0 = None
+        self.elapsed = None
+
+    # --------------------------------------------------------------------------
+    @staticmethod
+    def _framename(aFrame):
+        lCode = aFrame.f_code
+        return f"{lCode.co_name} ({basename(lCode.co_filename)}:{lCode.co_firstlineno})"
+
+    # --------------------------------------------------------------------------
+    def _sample(self):
+        lStackCache = {}
+        while not self._stop.wait(self.interval):
+            lFrame = sys._current_frames().get(self._target)
+            if lFrame is None:
+                continue
+
+            lStack = []
+            while lFrame is not None:
+                lCode = lFrame.f_code
+                lName = lStackCache.get(lCode)
+                if lName is None:
+                    lName = lStackCache[lCode] = self._framename(lFrame).replace(';', ':')
+                lStack.append(lName)
+                lFrame = lFrame.f_back
+            self.samples[';'.join(reversed(lStack))] += 1
+
+    # --------------------------------------------------------------------------
+    def start(self):
+        import cProfile
+
+        self._target = threading.get_ident()
+        self._t0 = time.perf_counter()
+
+        self._sampler = threading.Thread(target=self._sample, name='ipbb-profiler', daemon=True)
+        self._sampler.start()
+
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    # --------------------------------------------------------------------------
+    def stop(self):
+        if self._profile is None:
+            return
+        self._profile.disable()
+        self._stop.set()
+        self._sampler.join()
+        self.elapsed = time.perf_counter() - self._t0
+
+    # --------------------------------------------------------------------------
+    def dump(self, aPrefix):
+        """
+        Writes the profiling results to disk.
+
+        Args:
+            aPrefix (str): Output files prefix
+
+        Returns:
+            tuple: paths of the pstats and collapsed-stack files
+        """
+        lStatsPath = aPrefix + '.pstats'
+        lFoldedPath = aPrefix + '.folded'
+
+        self._profile.dump_stats(lStatsPath)
+        with open(lFoldedPath, 'w') as f:
+            for lStack, lCount in sorted(self.samples.items()):
+                f.write(f"{lStack} {lCount}\n")
+
+        return lStatsPath, lFoldedPath
+
+
+# ------------------------------------------------------------------------------
+class ProfiledGroup(click_didyoumean.DYMGroup):
+    """
+    Root command group supporting an optional-value '--profile[=path]' option.
+
+    Click does not support options with optional values: a bare '--profile'
+    preceding the subcommand is turned into '--profile=' before parsing.
+    """
+
+    def parse_args(self, ctx, args):
+        lArgs = list(args)
+        for i, lArg in enumerate(lArgs):
+            if not lArg.startswith('-'):
+                break
+            if lArg == kProfileOption:
+                lArgs[i] = kProfileOption + '='
+        return super().parse_args(ctx, lArgs)
+
+
+# ------------------------------------------------------------------------------
+def profileOption(f):
+    """
+    Adds the '--profile' option to a root command group.
+    """
+    return click.option(
+        kProfileOption,
+        'aProfile',
+        default=None,
+        metavar='[PATH]',
+        help="Profile the command and write pstats and collapsed stacks (flamegraph) files to PATH.<ext>",
+    )(f)
+
+
+# ------------------------------------------------------------------------------
+def enableProfiling(ctx, aPrefix):
+    """
+    Profiles the execution of the current command chain.
+
+    Profiling starts immediately and results are written when the root context
+    is closed, i.e. after the command chain has completed or failed.
+
+    Args:
+        ctx (click.Context): Root click context
+        aPrefix (str): Output files prefix. Defaults to a name based on the subcommand and time
+    """
+
+    if not aPrefix:
+        lCmds = [ctx.info_name.strip('-').replace('-', '_')] + ([ctx.invoked_subcommand] if ctx.invoked_subcommand else [])
+        aPrefix = '_'.join(lCmds + ['prof', time.strftime('%Y%m%d-%H%M%S')])
+    else:
+        lRoot, lExt = splitext(aPrefix)
+        if lExt in ('.pstats', '.prof', '.folded'):
+            aPrefix = lRoot
+
+    lProfiler = CommandProfiler()
+
+    def dumpProfile():
+        lProfiler.stop()
+        lStatsPath, lFoldedPath = lProfiler.dump(abspath(aPrefix))
+        cprint(
+            f"Profiling: {lProfiler.elapsed:.2f}s wall-clock, {sum(lProfiler.samples.values())} samples\n"
+            f"  pstats:          {lStatsPath}\n"
+            f"  collapsed stack: {lFoldedPath}",
+            style='cyan'
+        )
+
+    ctx.call_on_close(dumpProfile)
+    lProfiler.start()
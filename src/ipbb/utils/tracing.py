@@ -0,0 +1,257 @@
+import os
+import sys
+import json
+import time
+import atexit
+import functools
+import threading
+import importlib
+
+from os.path import isdir, join, basename
+
+kTraceEnvVar = 'IPBB_TRACE'
+
+# Active tracer, None when tracing is disabled
+_tracer = None
+
+
+# ------------------------------------------------------------------------------
+class Tracer(object):
+    """
+    Collects spans and writes them as Chrome/Perfetto trace events.
+
+    Attributes:
+        path (str): Output file path
+        events (list): Complete ('X') events recorded so far
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, aPath):
+        self.path = aPath
+        self.events = []
+        self._pid = os.getpid()
+        self._t0 = time.perf_counter()
+        self._threads = {}
+
+    # --------------------------------------------------------------------------
+    def now(self):
+        return (time.perf_counter() - self._t0) * 1e6
+
+    # --------------------------------------------------------------------------
+    def record(self, aName, aCategory, aStart, aArgs):
+        lThread = threading.current_thread()
+        self._threads.setdefault(lThread.ident, lThread.name)
+        lEvent = {
+            'name': aName,
+            'cat': aCategory,
+            'ph': 'X',
+            'ts': aStart,
+            'dur': self.now() - aStart,
+            'pid': self._pid,
+            'tid': lThread.ident,
+        }
+        if aArgs:
+            lEvent['args'] = aArgs
+        self.events.append(lEvent)
+
+    # --------------------------------------------------------------------------
+    def dump(self):
+        lMeta = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': lTid, 'args': {'name': lName}}
+            for lTid, lName in self._threads.items()
+        ]
+        lMeta.append({'name': 'process_name', 'ph': 'M', 'pid': self._pid, 'args': {'name': basename(sys.argv[0])}})
+
+        with open(self.path, 'w') as f:
+            json.dump({'traceEvents': lMeta + self.events, 'displayTimeUnit': 'ms'}, f)
+
+
+# ------------------------------------------------------------------------------
+class _Span(object):
+
+    __slots__ = ('name', 'category', 'args', '_start')
+
+    def __init__(self, aName, aCategory, aArgs):
+        self.name = aName
+        self.category = aCategory
+        self.args = aArgs
+
+    def __enter__(self):
+        self._start = _tracer.now()
+        return self
+
+    def __exit__(self, aExcType, aExcValue, aTraceback):
+        if aExcType is not None:
+            self.args['exception'] = aExcType.__name__
+        _tracer.record(self.name, self.category, self._start, self.args)
+
+
+# ------------------------------------------------------------------------------
+class _NullSpan(object):
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, aExcType, aExcValue, aTraceback):
+        pass
+
+
+_kNullSpan = _NullSpan()
+
+
+# ------------------------------------------------------------------------------
+def enabled():
+    return _tracer is not None
+
+
+# ------------------------------------------------------------------------------
+def span(aName, aCategory='ipbb', **aArgs):
+    """
+    Returns a context manager recording a span, or a no-op one when tracing is off.
+
+    Args:
+        aName (str): Span name
+        aCategory (str): Span category
+        **aArgs: Additional span arguments
+    """
+    if _tracer is None:
+        return _kNullSpan
+    return _Span(aName, aCategory, aArgs)
+
+
+# ------------------------------------------------------------------------------
+def traced(aFunc, aName, aCategory, aArgsFn=None):
+    """
+    Wraps a callable into a span.
+
+    Args:
+        aFunc (callable): Function to wrap
+        aName (str or callable): Span name, or function of the call arguments returning it
+        aCategory (str): Span category
+        aArgsFn (callable): Function of the call arguments returning the span arguments
+    """
+
+    @functools.wraps(aFunc)
+    def wrapper(*args, **kwargs):
+        if _tracer is None:
+            return aFunc(*args, **kwargs)
+        lName = aName(*args, **kwargs) if callable(aName) else aName
+        lArgs = aArgsFn(*args, **kwargs) if aArgsFn is not None else {}
+        with _Span(lName, aCategory, lArgs):
+            return aFunc(*args, **kwargs)
+
+    wrapper.__traced__ = aFunc
+    return wrapper
+
+
+# ------------------------------------------------------------------------------
+def _shorten(aText, aMaxLen=200):
+    aText = str(aText)
+    return aText if len(aText) <= aMaxLen else aText[:aMaxLen] + '...'
+
+
+# ------------------------------------------------------------------------------
+def _consoleArgs(self, aCmd='', *args, **kwargs):
+    return {'cmd': _shorten(aCmd)}
+
+
+# ------------------------------------------------------------------------------
+def _parseArgs(self, aPackage, aComponent, aDepFileName, *args, **kwargs):
+    return {'package': aPackage, 'component': aComponent, 'depfile': aDepFileName}
+
+
+# ------------------------------------------------------------------------------
+def _shName(self, *args, **kwargs):
+    lPath = self._path
+    if isinstance(lPath, bytes):
+        lPath = lPath.decode()
+    return 'sh:' + basename(lPath)
+
+
+# ------------------------------------------------------------------------------
+def _shArgs(self, *args, **kwargs):
+    return {'args': _shorten(' '.join(str(a) for a in args))}
+
+
+# Methods instrumented by install:
+# (module, class, method, span name, category, span arguments)
+_kTracedMethods = [
+    ('ipbb.context', 'Context', '_autodetect', 'context.autodetect', 'context', None),
+    ('ipbb.depparser._fileparser', 'DepFileParser', 'parse', 'dep.parse', 'depparser', _parseArgs),
+    ('ipbb.generators.vivadoproject', 'VivadoProjectGenerator', 'write', 'VivadoProjectGenerator.write', 'generate', None),
+    ('ipbb.generators.modelsimproject', 'ModelSimGenerator', 'write', 'ModelSimGenerator.write', 'generate', None),
+    ('ipbb.generators.ipcoressim', 'IPCoresSimGenerator', 'write', 'IPCoresSimGenerator.write', 'generate', None),
+    ('ipbb.generators.vitishlsproject', 'VitisHLSProjectGenerator', 'write', 'VitisHLSProjectGenerator.write', 'generate', None),
+    ('ipbb.generators.hlsiprepoxci', 'HLSIpRepoXciGenerator', 'write', 'HLSIpRepoXciGenerator.write', 'generate', None),
+    ('ipbb.tools.xilinx.vivado_console', 'VivadoConsole', 'execute', 'vivado.execute', 'vivado', _consoleArgs),
+    ('ipbb.tools.xilinx.vitishls_console', 'VitisHLSConsole', 'execute', 'vitishls.execute', 'vitishls', _consoleArgs),
+    ('ipbb.tools.mentor.sim_console', 'ModelSimConsole', 'execute', 'modelsim.execute', 'modelsim', _consoleArgs),
+    ('sh', 'Command', '__call__', _shName, 'subprocess', _shArgs),
+]
+
+# Functions instrumented by install, including the aliases imported by other ipbb modules
+# (module, function, span name, category, importing modules)
+_kTracedFunctions = [
+    ('ipbb.utils.validation', 'validate', 'validate', 'validation', ['ipbb.context', 'ipbb.cmds.schema', 'ipbb.depparser._cmdparser', 'ipbb.depparser._fileparser']),
+]
+
+
+# ------------------------------------------------------------------------------
+def _instrument():
+
+    for lModName, lClsName, lMethod, lName, lCategory, lArgsFn in _kTracedMethods:
+        try:
+            lCls = getattr(importlib.import_module(lModName), lClsName)
+        except ImportError:
+            continue
+        lFunc = lCls.__dict__[lMethod]
+        if hasattr(lFunc, '__traced__'):
+            continue
+        setattr(lCls, lMethod, traced(lFunc, lName, lCategory, lArgsFn))
+
+    for lModName, lFuncName, lName, lCategory, lImporters in _kTracedFunctions:
+        lFunc = getattr(importlib.import_module(lModName), lFuncName)
+        if hasattr(lFunc, '__traced__'):
+            continue
+        lWrapper = traced(lFunc, lName, lCategory)
+        # Rebind the 'from x import f' aliases too
+        for lOther in [lModName] + lImporters:
+            lOther = importlib.import_module(lOther)
+            if getattr(lOther, lFuncName, None) is lFunc:
+                setattr(lOther, lFuncName, lWrapper)
+
+
+# ------------------------------------------------------------------------------
+def install(aPath=None):
+    """
+    Enables tracing if a trace destination is given or set in the environment.
+
+    The relevant ipbb entry points are wrapped into spans; no change is needed
+    at the call sites. The trace is written when the interpreter exits.
+
+    Args:
+        aPath (str): Trace output path. Defaults to the IPBB_TRACE variable.
+            If a directory, the trace is written there as ipbb_trace_<pid>.json
+
+    Returns:
+        Tracer: the active tracer, or None if tracing is disabled
+    """
+    global _tracer
+
+    aPath = aPath or os.environ.get(kTraceEnvVar)
+    if not aPath:
+        return None
+
+    if _tracer is not None:
+        return _tracer
+
+    if isdir(aPath):
+        aPath = join(aPath, f'ipbb_trace_{os.getpid()}.json')
+
+    _instrument()
+
+    _tracer = Tracer(aPath)
+    atexit.register(_tracer.dump)
+    return _tracer
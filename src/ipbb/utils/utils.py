@@ -144,6 +144,39 @@ def findFileDirInParents(aFileName : str, aDirPath : str) -> str:
 # ------------------------------------------------------------------------------
 
 
+# ------------------------------------------------------------------------------
+def findSignaturesInParents(aFileNames : list, aDirPath : str, aStopAt : str = None) -> dict:
+    """
+    Find, with a single upward walk of the directory tree, the folders in which
+    a set of signature files are located.
+    
+    Args:
+        aFileNames (list): Names of the files to search
+        aDirPath (str): Search path
+        aStopAt (str, optional): Name of the file that terminates the walk when found
+    
+    Returns:
+        dict: File name to containing folder mapping. Folders are None if the file was not found
+    """
+    lFound = dict.fromkeys(aFileNames)
+    lMissing = list(aFileNames)
+
+    lDirPath = aDirPath
+    while lDirPath != '/' and lMissing:
+        for lFileName in list(lMissing):
+            if not exists(join(lDirPath, lFileName)):
+                continue
+            lFound[lFileName] = lDirPath
+            lMissing.remove(lFileName)
+
+        if aStopAt is not None and lFound.get(aStopAt) is not None:
+            break
+        lDirPath, _ = split(lDirPath)
+
+    return lFound
+# ------------------------------------------------------------------------------
+
+
 # ------------------------------------------------------------------------------
 def findFileInParents(aFileName : str, aDirPath : str=os.getcwd()) -> str:
     """
@@ -222,6 +255,29 @@ def ensureNoMissingFiles(aCurrentProj, aDepFileParser):
 # ------------------------------------------------------------------------------
 
 
+# ------------------------------------------------------------------------------
+def availableJobSlots(aMemPerJob : int, aMaxJobs : int = None) -> int:
+    """
+    Estimates how many jobs can run concurrently on this machine, given the
+    cores available to this process and the memory currently available.
+    
+    Args:
+        aMemPerJob (int): Memory required by each job, in bytes
+        aMaxJobs (int, optional): Upper limit
+    
+    Returns:
+        int: Number of job slots, at least 1
+    """
+    import psutil
+
+    lCpus = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
+    lSlots = min(lCpus or 1, int(psutil.virtual_memory().available // aMemPerJob))
+    if aMaxJobs is not None:
+        lSlots = min(lSlots, aMaxJobs)
+    return max(1, lSlots)
+# ------------------------------------------------------------------------------
+
+
 # ------------------------------------------------------------------------------
 def logVivadoConsoleError( aExc ):
     console.log("Vivado error/critical warnings detected", style='red')
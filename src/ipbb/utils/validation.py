@@ -0,0 +1,159 @@
+import os
+import json
+import hashlib
+
+from os.path import join, expanduser, dirname
+
+from .. import __version__
+
+# Compiled validators, keyed by schema fingerprint
+_validators = {}
+# Validation results of this process, keyed by (schema + document) fingerprint
+_results = {}
+
+
+# ------------------------------------------------------------------------------
+def _fingerprint(*aObjs):
+    """
+    Computes a stable fingerprint of a set of json-like objects.
+
+    Returns:
+        str: hex digest, or None if the objects cannot be serialised
+    """
+    try:
+        lBlob = json.dumps(aObjs, sort_keys=True, default=repr)
+    except TypeError:
+        # Non-sortable keys (e.g. mixed types), skip caching
+        return None
+    return hashlib.sha1(lBlob.encode()).hexdigest()
+
+
+# ------------------------------------------------------------------------------
+class ValidationStore(object):
+    """
+    Persistent record of the fingerprints of documents known to be valid.
+
+    The store lives in the user cache folder and allows skipping validation
+    (and the import of cerberus) altogether for settings that were already
+    validated by a previous invocation.
+    """
+
+    kMaxEntries = 1024
+
+    _instance = None
+
+    # --------------------------------------------------------------------------
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls(cls.defaultpath())
+        return cls._instance
+
+    # --------------------------------------------------------------------------
+    @staticmethod
+    def defaultpath():
+        lCacheDir = os.environ.get('XDG_CACHE_HOME') or join(expanduser('~'), '.cache')
+        return join(lCacheDir, 'ipbb', 'validated')
+
+    # --------------------------------------------------------------------------
+    def __init__(self, aPath):
+        self.path = aPath
+        self._keys = None
+
+    # --------------------------------------------------------------------------
+    def _load(self):
+        if self._keys is not None:
+            return
+
+        lKeys = []
+        try:
+            with open(self.path) as f:
+                lKeys = f.read().split()
+        except OSError:
+            pass
+
+        if len(lKeys) > self.kMaxEntries:
+            lKeys = lKeys[-(self.kMaxEntries // 2):]
+            self._write(lKeys, 'w')
+
+        self._keys = set(lKeys)
+
+    # --------------------------------------------------------------------------
+    def _write(self, aKeys, aMode):
+        try:
+            os.makedirs(dirname(self.path), exist_ok=True)
+            with open(self.path, aMode) as f:
+                f.write(''.join(k + '\n' for k in aKeys))
+        except OSError:
+            # The cache is an optimisation only
+            pass
+
+    # --------------------------------------------------------------------------
+    def __contains__(self, aKey):
+        self._load()
+        return aKey in self._keys
+
+    # --------------------------------------------------------------------------
+    def add(self, aKey):
+        self._load()
+        if aKey in self._keys:
+            return
+        self._keys.add(aKey)
+        self._write([aKey], 'a')
+
+
+# ------------------------------------------------------------------------------
+def getValidator(aSchema, **aOptions):
+    """
+    Returns the compiled validator for a schema, building it on first use.
+
+    Args:
+        aSchema (dict): Cerberus schema
+        **aOptions: Validator options (e.g. allow_unknown)
+
+    Returns:
+        cerberus.Validator: the validator
+    """
+    lKey = _fingerprint(aSchema, aOptions) or id(aSchema)
+    lValidator = _validators.get(lKey)
+    if lValidator is None:
+        # https://docs.python-cerberus.org/en/stable/install.html
+        import cerberus
+        lValidator = _validators[lKey] = cerberus.Validator(aSchema, **aOptions)
+    return lValidator
+
+
+# ------------------------------------------------------------------------------
+def validate(aSchema, aDocument, **aOptions):
+    """
+    Validates a document against a schema, memoising the outcome.
+
+    Successful validations are also recorded in the persistent store, so that
+    unchanged settings are not re-validated by later invocations.
+
+    Args:
+        aSchema (dict): Cerberus schema
+        aDocument (dict): Document to validate
+        **aOptions: Validator options (e.g. allow_unknown)
+
+    Returns:
+        dict: validation errors, empty if the document is valid
+    """
+    lKey = _fingerprint(__version__, aSchema, aOptions, aDocument)
+
+    if lKey is not None:
+        if lKey in _results:
+            return _results[lKey]
+        if lKey in ValidationStore.instance():
+            _results[lKey] = {}
+            return {}
+
+    lValidator = getValidator(aSchema, **aOptions)
+    lErrors = {} if lValidator.validate(aDocument) else dict(lValidator.errors)
+
+    if lKey is not None:
+        _results[lKey] = lErrors
+        if not lErrors:
+            ValidationStore.instance().add(lKey)
+
+    return lErrors
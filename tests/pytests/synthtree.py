@@ -0,0 +1,68 @@
+"""
+Synthetic source trees for benchmarks and resource-usage tests.
+"""
+
+from os import makedirs
+from os.path import join
+
+
+# -----------------------------------------------------------------------------
+def make_synth_tree(aRoot, aPackages=4, aComponents=10, aFiles=50):
+    """
+    Creates a synthetic source tree under aRoot.
+
+    The top component of the first package includes every component of every
+    package. Each component depends on the previous one of the same package
+    (diamond-free chain) and lists aFiles vhdl sources plus a constraint file.
+
+    Args:
+        aRoot (str): Source area path (i.e. the Pathmaker root directory)
+        aPackages (int): Number of packages
+        aComponents (int): Number of components per package
+        aFiles (int): Number of source files per component
+
+    Returns:
+        tuple: top package, top component and top dep file names
+    """
+
+    for p in range(aPackages):
+        lPkg = f'pkg{p}'
+        for c in range(aComponents):
+            lCmp = f'cmp{c}'
+            lCfgDir = join(aRoot, lPkg, lCmp, 'firmware', 'cfg')
+            lHdlDir = join(aRoot, lPkg, lCmp, 'firmware', 'hdl')
+            makedirs(lCfgDir)
+            makedirs(lHdlDir)
+
+            lLines = [f'@{lPkg}_{lCmp}_files = {aFiles}']
+            if c > 0:
+                lLines.append(f'include -c {lPkg}:cmp{c-1} top.dep')
+            for f in range(aFiles):
+                lName = f'{lPkg}_{lCmp}_f{f}.vhd'
+                with open(join(lHdlDir, lName), 'w') as lFile:
+                    lFile.write(f'-- {lName}\n')
+                lLines.append(f'src {lName}' if f % 2 else f'src --vhdl2008 -l lib_{lPkg} {lName}')
+
+            lXdc = f'{lPkg}_{lCmp}.xdc'
+            with open(join(lHdlDir, lXdc), 'w') as lFile:
+                lFile.write('\n')
+            lLines.append(f'src {lXdc}')
+
+            with open(join(lCfgDir, 'top.dep'), 'w') as lFile:
+                lFile.write('\n'.join(lLines) + '\n')
+
+    lTopDir = join(aRoot, 'pkg0', 'top', 'firmware', 'cfg')
+    makedirs(lTopDir)
+    lLines = [
+        '@device_name = "xcku15p"',
+        '@device_package = "-ffva1760"',
+        '@device_speed = "-2-e"',
+        'setup -f settings.tcl',
+    ]
+    lLines += [f'include -c pkg{p}:cmp{aComponents-1} top.dep' for p in range(aPackages)]
+    with open(join(lTopDir, 'top.dep'), 'w') as lFile:
+        lFile.write('\n'.join(lLines) + '\n')
+    with open(join(lTopDir, 'settings.tcl'), 'w') as lFile:
+        lFile.write('\n')
+
+    return 'pkg0', 'top', 'top.dep'
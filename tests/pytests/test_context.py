@@ -0,0 +1,46 @@
+import pytest
+
+from os.path import join
+from ipbb.context import Context
+from ipbb.defaults import kWorkAreaFile, kProjAreaFile
+from ipbb.utils import findSignaturesInParents
+
+
+# -----------------------------------------------------------------------------
+@pytest.fixture
+def work_area(tmp_path):
+    lProjPath = tmp_path / 'work' / 'proj' / 'p1'
+    (lProjPath / 'sub').mkdir(parents=True)
+    (tmp_path / 'work' / 'src').mkdir()
+    (tmp_path / 'work' / kWorkAreaFile).write_text('\n')
+    (lProjPath / kProjAreaFile).write_text('name: p1\ntoolset: vivado\n')
+    return tmp_path / 'work'
+
+
+# -----------------------------------------------------------------------------
+def test_find_signatures(work_area):
+
+    lFound = findSignaturesInParents([kProjAreaFile, kWorkAreaFile], str(work_area / 'proj' / 'p1' / 'sub'), aStopAt=kWorkAreaFile)
+    assert lFound[kWorkAreaFile] == str(work_area)
+    assert lFound[kProjAreaFile] == str(work_area / 'proj' / 'p1')
+
+    lFound = findSignaturesInParents([kProjAreaFile, kWorkAreaFile], str(work_area / 'src'), aStopAt=kWorkAreaFile)
+    assert lFound[kWorkAreaFile] == str(work_area)
+    assert lFound[kProjAreaFile] is None
+
+
+# -----------------------------------------------------------------------------
+def test_context_lazy_settings(work_area):
+
+    ictx = Context(str(work_area / 'proj' / 'p1' / 'sub'))
+    assert ictx.work.path == str(work_area)
+    assert ictx.currentproj.name == 'p1'
+
+    # Settings are only loaded when needed
+    assert ictx.currentproj._settings is None
+    assert ictx.currentproj.settings['toolset'] == 'vivado'
+    assert ictx.currentproj.usersettings == {}
+
+    # A second detection from the same folder hits the cache
+    ictx = Context(str(work_area / 'proj' / 'p1' / 'sub'))
+    assert ictx.currentproj.path == join(str(work_area), 'proj', 'p1')
@@ -0,0 +1,138 @@
+import io
+import types
+import resource
+import tracemalloc
+
+import pytest
+
+from rich.console import Console
+
+from ipbb.depparser import DepFileParser, DepFormatter, Pathmaker
+from ipbb.generators.vivadoproject import VivadoProjectGenerator
+from ipbb.generators.modelsimproject import ModelSimGenerator
+from ipbb.generators.ipcoressim import IPCoresSimGenerator
+from ipbb.generators.vitishlsproject import VitisHLSProjectGenerator
+from ipbb.generators.hlsiprepoxci import HLSIpRepoXciGenerator
+
+from .synthtree import make_synth_tree
+
+# Synthetic tree size: packages x components x files
+kTreeSize = (4, 10, 50)
+
+# Peak python heap budgets per stage, in MiB
+kBudgets = {
+    'parse': 4,
+    'format': 1,
+    'VivadoProjectGenerator': 1,
+    'ModelSimGenerator': 2,
+    'IPCoresSimGenerator': 0.5,
+    'VitisHLSProjectGenerator': 0.5,
+    'HLSIpRepoXciGenerator': 0.5,
+}
+
+
+# -----------------------------------------------------------------------------
+def peak_memory(aFunc):
+    """
+    Runs aFunc and returns its result and the peak traced heap size in MiB
+    """
+    tracemalloc.start()
+    try:
+        lResult = aFunc()
+        _, lPeak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return lResult, lPeak / 2**20
+
+
+# -----------------------------------------------------------------------------
+def max_rss():
+    """
+    Process peak resident set size in MiB
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+
+
+# -----------------------------------------------------------------------------
+class Sink(object):
+    """
+    Generator output target discarding the commands, answering as a tool console would
+    """
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, aCmd='', aMaxLen=1):
+        self.count += 1
+        return ('xilinx.com:hls:top:1.0',)
+
+
+# -----------------------------------------------------------------------------
+@pytest.fixture(scope='module')
+def synth_tree(tmp_path_factory):
+    lRoot = str(tmp_path_factory.mktemp('src'))
+    lTop = make_synth_tree(lRoot, *kTreeSize)
+    return lRoot, lTop
+
+
+# -----------------------------------------------------------------------------
+@pytest.fixture(scope='module')
+def synth_parser(synth_tree):
+    lRoot, lTop = synth_tree
+    lParser = DepFileParser('vivado', Pathmaker(lRoot), {}, 0)
+    lParser.parse(*lTop)
+    return lParser
+
+
+# -----------------------------------------------------------------------------
+def test_parse_memory(synth_tree, record_property):
+    lRoot, lTop = synth_tree
+    lParser = DepFileParser('vivado', Pathmaker(lRoot), {}, 0)
+
+    _, lPeak = peak_memory(lambda: lParser.parse(*lTop))
+
+    assert not lParser.errors and not lParser.unresolved
+    assert len(lParser.commands['src']) == kTreeSize[0] * kTreeSize[1] * (kTreeSize[2] + 1)
+
+    record_property('peak_mib', lPeak)
+    record_property('max_rss_mib', max_rss())
+    assert lPeak < kBudgets['parse']
+
+
+# -----------------------------------------------------------------------------
+def test_format_memory(synth_parser, record_property):
+    lConsole = Console(file=io.StringIO(), width=120)
+    lFormatter = DepFormatter(synth_parser)
+
+    def render():
+        lConsole.print(lFormatter.draw_summary())
+        lConsole.print(lFormatter.draw_depfile_tree())
+
+    _, lPeak = peak_memory(render)
+
+    record_property('peak_mib', lPeak)
+    assert lPeak < kBudgets['format']
+
+
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize('aGenerator', list(kBudgets)[2:])
+def test_generator_memory(aGenerator, synth_parser, tmp_path, record_property):
+
+    lProj = types.SimpleNamespace(name='synth', path=str(tmp_path))
+    lGenerators = {
+        'VivadoProjectGenerator': lambda: VivadoProjectGenerator(lProj, None, True),
+        'ModelSimGenerator': lambda: ModelSimGenerator(lProj, 'xil_defaultlib', 'top_sim', True),
+        'IPCoresSimGenerator': lambda: IPCoresSimGenerator(lProj, 'simlib', 'modelsim', 'ipcores', 'top_sim'),
+        'VitisHLSProjectGenerator': lambda: VitisHLSProjectGenerator(lProj, 'sol1'),
+        'HLSIpRepoXciGenerator': lambda: HLSIpRepoXciGenerator('catalog', 'hls_ip', 'export'),
+    }
+    lGenerator = lGenerators[aGenerator]()
+    lLast = synth_parser.rootdir if aGenerator == 'VitisHLSProjectGenerator' else synth_parser.libs
+
+    lSink = Sink()
+    _, lPeak = peak_memory(
+        lambda: lGenerator.write(lSink, synth_parser.settings, synth_parser.packages, synth_parser.commands, lLast)
+    )
+
+    assert lSink.count > 0
+    record_property('peak_mib', lPeak)
+    assert lPeak < kBudgets[aGenerator]
@@ -0,0 +1,48 @@
+import time
+import click
+
+from os.path import splitext
+
+from click.testing import CliRunner
+from ipbb.utils.profiler import ProfiledGroup, profileOption, enableProfiling
+
+
+# -----------------------------------------------------------------------------
+@click.group(cls=ProfiledGroup)
+@profileOption
+@click.pass_context
+def dummy(ctx, aProfile):
+    if aProfile is not None:
+        enableProfiling(ctx, aProfile)
+
+
+@dummy.command()
+def wait():
+    time.sleep(0.1)
+
+
+# -----------------------------------------------------------------------------
+def test_profile_path(tmp_path):
+    lPrefix = str(tmp_path / 'prof')
+    lResult = CliRunner().invoke(dummy, [f'--profile={lPrefix}.pstats', 'wait'])
+    assert lResult.exit_code == 0, lResult.output
+
+    assert (tmp_path / 'prof.pstats').exists()
+    # Time spent blocked shows up in the sampled stacks
+    lFolded = (tmp_path / 'prof.folded').read_text()
+    assert 'wait (test_profiler.py' in lFolded
+
+
+# -----------------------------------------------------------------------------
+def test_profile_default(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    lResult = CliRunner().invoke(dummy, ['--profile', 'wait'])
+    assert lResult.exit_code == 0, lResult.output
+    lFiles = sorted(p.name for p in tmp_path.glob('dummy_wait_prof_*'))
+    assert [splitext(f)[1] for f in lFiles] == ['.folded', '.pstats']
+
+    # No profiling without the flag
+    lResult = CliRunner().invoke(dummy, ['wait'])
+    assert lResult.exit_code == 0
+    assert len(list(tmp_path.iterdir())) == 2
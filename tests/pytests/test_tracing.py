@@ -0,0 +1,41 @@
+import json
+import sh
+
+from ipbb.utils import tracing
+from ipbb.utils.tracing import Tracer, span
+from ipbb.context import Context
+from ipbb.cmds.schema import project_schema, validate_schema
+
+
+# -----------------------------------------------------------------------------
+def test_span_disabled(monkeypatch):
+    monkeypatch.setattr(tracing, '_tracer', None)
+    with span('nothing', x=1) as s:
+        pass
+    assert s is tracing._kNullSpan
+
+
+# -----------------------------------------------------------------------------
+def test_trace_instrumentation(tmp_path, monkeypatch):
+    tracing._instrument()
+    lTracer = Tracer(str(tmp_path / 'trace.json'))
+    monkeypatch.setattr(tracing, '_tracer', lTracer)
+
+    class Settings(dict):
+        def dict(self):
+            return dict(self)
+
+    with span('outer', 'test', step=1):
+        Context(str(tmp_path))
+        validate_schema(project_schema, Settings(toolset='sim', device_name='a', device_speed='b', device_package='c'))
+        sh.Command('true')()
+
+    lTracer.dump()
+    with open(tmp_path / 'trace.json') as f:
+        lEvents = json.load(f)['traceEvents']
+
+    lNames = [e['name'] for e in lEvents if e['ph'] == 'X']
+    assert lNames == ['context.autodetect', 'validate', 'sh:true', 'outer']
+    lOuter = lEvents[-1]
+    assert lOuter['args'] == {'step': 1}
+    assert all(lOuter['ts'] <= e['ts'] and e['ts'] + e['dur'] <= lOuter['ts'] + lOuter['dur'] for e in lEvents if e['ph'] == 'X')
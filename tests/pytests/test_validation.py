@@ -0,0 +1,50 @@
+import sys
+import pytest
+
+from ipbb.utils import validation
+from ipbb.utils.validation import validate, getValidator, ValidationStore
+from ipbb.cmds.schema import project_schema
+
+
+# -----------------------------------------------------------------------------
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    lStore = ValidationStore(str(tmp_path / 'ipbb' / 'validated'))
+    monkeypatch.setattr(ValidationStore, '_instance', lStore)
+    monkeypatch.setattr(validation, '_results', {})
+    return lStore
+
+
+# -----------------------------------------------------------------------------
+def test_validator_cache(store):
+    assert getValidator(project_schema, allow_unknown=True) is getValidator(dict(project_schema), allow_unknown=True)
+    assert getValidator(project_schema, allow_unknown=True) is not getValidator(project_schema)
+
+
+# -----------------------------------------------------------------------------
+def test_validate(store):
+    lSettings = {'toolset': 'vivado', 'device_name': 'xcvu9p', 'device_speed': '-2', 'device_package': 'flga2104', 'extra': 1}
+
+    assert validate(project_schema, lSettings, allow_unknown=True) == {}
+    assert 'extra' in validate(project_schema, lSettings)
+    assert 'toolset' in validate(project_schema, dict(lSettings, toolset='quartus'), allow_unknown=True)
+
+    # Only successful validations are persisted
+    with open(store.path) as f:
+        assert len(f.read().split()) == 1
+
+
+# -----------------------------------------------------------------------------
+def test_validate_cached_skips_cerberus(store, monkeypatch):
+    lSettings = {'toolset': 'sim', 'device_name': 'xcku15p', 'device_speed': '-2', 'device_package': 'ffva1760'}
+    assert validate(project_schema, lSettings, allow_unknown=True) == {}
+
+    # New process: no in-memory results, no compiled validators, no cerberus
+    monkeypatch.setattr(validation, '_results', {})
+    monkeypatch.setattr(validation, '_validators', {})
+    monkeypatch.setattr(ValidationStore, '_instance', ValidationStore(store.path))
+    monkeypatch.setitem(sys.modules, 'cerberus', None)
+
+    assert validate(project_schema, lSettings, allow_unknown=True) == {}
+    with pytest.raises(ImportError):
+        validate(project_schema, dict(lSettings, toolset='vivado'), allow_unknown=True)
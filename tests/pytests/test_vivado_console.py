@@ -0,0 +1,112 @@
+import os
+import shutil
+import pytest
+
+from os.path import dirname, join
+
+from ipbb.tools.xilinx import VivadoConsole, VivadoConsoleError, VivadoCommandBatch
+
+kFakesDir = join(dirname(__file__), 'fakes')
+
+pytestmark = pytest.mark.skipif(shutil.which('tclsh') is None, reason='tclsh not available')
+
+
+# -----------------------------------------------------------------------------
+@pytest.fixture
+def vivado(tmp_path, monkeypatch):
+    monkeypatch.setenv('PATH', kFakesDir + os.pathsep + os.environ['PATH'])
+    monkeypatch.chdir(tmp_path)
+    lConsole = VivadoConsole(sid='test', loglevel='none')
+    yield lConsole
+    lConsole.close()
+
+
+# -----------------------------------------------------------------------------
+def test_execute_batch(vivado):
+    lOutputs = vivado.execute_batch(['set a 4', 'expr {$a + 1}', 'set b "x{y $a"', 'set c {}'])
+    assert [o[-1].strip() if o[-1] else o[-1] for o in lOutputs] == ['4', '5', 'x{y 4', None]
+    assert vivado.execute('set b')[-1].strip() == 'x{y 4'
+
+
+# -----------------------------------------------------------------------------
+def test_execute_batch_error_message(vivado):
+    with pytest.raises(VivadoConsoleError) as lExcInfo:
+        vivado.execute_batch(['set a 1', 'send_msg ERROR {Synth 8-1} broken', 'set b 2'])
+
+    assert lExcInfo.value.command == 'send_msg ERROR {Synth 8-1} broken'
+    assert len(lExcInfo.value.errors) == 1
+    assert lExcInfo.value.errors[0].startswith('ERROR: [Synth 8-1]')
+
+
+# -----------------------------------------------------------------------------
+def test_execute_batch_tcl_error(vivado):
+    with pytest.raises(VivadoConsoleError) as lExcInfo:
+        vivado.execute_batch(['set a 1', 'no_such_command', 'set b 2'])
+
+    assert lExcInfo.value.command == 'no_such_command'
+    # Execution stops at the failing command
+    assert vivado.execute('info exists b')[-1].strip() == '0'
+
+
+# -----------------------------------------------------------------------------
+def test_execute_batch_critical_warnings(vivado):
+    lCmds = ['send_msg {CRITICAL WARNING} {Vivado 12-1} careful', 'set a 1']
+    vivado.execute_batch(lCmds)
+
+    vivado.stopOnCWarnings = True
+    with pytest.raises(VivadoConsoleError) as lExcInfo:
+        vivado.execute_batch(lCmds)
+    assert lExcInfo.value.command == lCmds[0]
+    assert len(lExcInfo.value.criticalWarns) == 1
+
+
+# -----------------------------------------------------------------------------
+def test_command_batch(vivado):
+    lBatch = VivadoCommandBatch(vivado, aSize=3)
+    for i in range(5):
+        lBatch(f'lappend l {i}')
+    lBatch()
+    # First batch flushed on size
+    assert vivado.execute('llength $l')[-1].strip() == '3'
+    lBatch.flush()
+    assert vivado.execute('set l')[-1].strip() == '0 1 2 3 4'
+
+
+# -----------------------------------------------------------------------------
+@pytest.fixture
+def framed_vivado(tmp_path, monkeypatch):
+    monkeypatch.setenv('PATH', kFakesDir + os.pathsep + os.environ['PATH'])
+    monkeypatch.chdir(tmp_path)
+    lConsole = VivadoConsole(sid='test', loglevel='none', framed=True)
+    yield lConsole
+    lConsole.close()
+
+
+# -----------------------------------------------------------------------------
+def test_framed_execute(framed_vivado):
+    assert framed_vivado.framed
+    assert framed_vivado.execute('set a 3') == ('3',)
+    assert framed_vivado.execute('set b {}') == (None,)
+    # Output lines precede the result, which is returned verbatim
+    assert framed_vivado.execute('puts hello; set c "x\\ny\\\\z\\r"', 10) == ('hello', 'x', 'y\\z\r')
+    assert framed_vivado.execute('set c', 1) == ('y\\z\r',)
+
+
+# -----------------------------------------------------------------------------
+def test_framed_errors(framed_vivado):
+    with pytest.raises(VivadoConsoleError) as lExcInfo:
+        framed_vivado.execute('send_msg ERROR {Synth 8-1} broken')
+    assert lExcInfo.value.errors == ['ERROR: [Synth 8-1] broken']
+
+    with pytest.raises(VivadoConsoleError) as lExcInfo:
+        framed_vivado.execute('no_such_command')
+    assert lExcInfo.value.errors == ['ERROR: invalid command name "no_such_command"']
+
+    framed_vivado.execute('send_msg {CRITICAL WARNING} {Vivado 12-1} careful')
+    framed_vivado.stopOnCWarnings = True
+    with pytest.raises(VivadoConsoleError) as lExcInfo:
+        framed_vivado.execute('send_msg {CRITICAL WARNING} {Vivado 12-1} careful')
+    assert len(lExcInfo.value.criticalWarns) == 1
+
+    # The session is still usable
+    assert framed_vivado.execute('expr {1 + 1}') == ('2',)
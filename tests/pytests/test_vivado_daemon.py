@@ -0,0 +1,73 @@
+import os
+import shutil
+import tempfile
+import pytest
+
+from os.path import dirname, join, exists
+
+from ipbb.tools.xilinx import (
+    VivadoConsoleError, VivadoConsoleProxy, VivadoDaemonError,
+    sessionSocketPath, sessionDaemonStatus, startSessionDaemon, stopSessionDaemon
+)
+
+kFakesDir = join(dirname(__file__), 'fakes')
+
+pytestmark = pytest.mark.skipif(shutil.which('tclsh') is None, reason='tclsh not available')
+
+
+# -----------------------------------------------------------------------------
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    monkeypatch.setenv('PATH', kFakesDir + os.pathsep + os.environ['PATH'])
+    # Keep the socket path short
+    lRuntimeDir = tempfile.mkdtemp(prefix='ipbb', dir='/tmp')
+    monkeypatch.setenv('XDG_RUNTIME_DIR', lRuntimeDir)
+
+    lSocket = sessionSocketPath(str(tmp_path))
+    startSessionDaemon(lSocket, str(tmp_path), aTimeout=30.)
+    yield lSocket
+    stopSessionDaemon(lSocket)
+    shutil.rmtree(lRuntimeDir)
+
+
+# -----------------------------------------------------------------------------
+def test_daemon_state_survives_clients(daemon):
+    lProxy = VivadoConsoleProxy(daemon, sid='first')
+    assert lProxy.variant == 'vivado'
+    lProxy('create_project top')
+    lProxy.close()
+
+    lProxy = VivadoConsoleProxy(daemon, sid='second')
+    assert lProxy('current_project -quiet') == ('top',)
+    assert lProxy.execute_batch(['set a 2', 'expr {$a * 3}']) == [('2',), ('6',)]
+    lProxy.close()
+
+    assert sessionDaemonStatus(daemon)['project'] == 'top'
+
+
+# -----------------------------------------------------------------------------
+def test_daemon_relays_errors_and_output(daemon, capsys):
+    lProxy = VivadoConsoleProxy(daemon, sid='errors')
+    with pytest.raises(VivadoConsoleError) as lExcInfo:
+        lProxy('send_msg ERROR {Synth 8-1} broken')
+    assert lExcInfo.value.errors[0].startswith('ERROR: [Synth 8-1]')
+
+    lProxy.stopOnCWarnings = True
+    with pytest.raises(VivadoConsoleError):
+        lProxy('send_msg {CRITICAL WARNING} {Vivado 12-1} careful')
+    lProxy.close()
+
+    assert 'broken' in capsys.readouterr().out
+
+
+# -----------------------------------------------------------------------------
+def test_daemon_busy_and_stop(daemon):
+    lProxy = VivadoConsoleProxy(daemon)
+    assert sessionDaemonStatus(daemon) == {'busy': True}
+    lProxy.close()
+
+    assert stopSessionDaemon(daemon)
+    assert sessionDaemonStatus(daemon) is None
+    assert not exists(daemon)
+    with pytest.raises(VivadoDaemonError):
+        VivadoConsoleProxy(daemon)
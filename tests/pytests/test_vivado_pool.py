@@ -0,0 +1,81 @@
+import os
+import shutil
+import pytest
+
+from os.path import dirname, join
+
+from ipbb.tools.xilinx import VivadoConsolePool, VivadoPooledSession
+from ipbb.utils import availableJobSlots
+
+kFakesDir = join(dirname(__file__), 'fakes')
+
+pytestmark = pytest.mark.skipif(shutil.which('tclsh') is None, reason='tclsh not available')
+
+
+# -----------------------------------------------------------------------------
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    monkeypatch.setenv('PATH', kFakesDir + os.pathsep + os.environ['PATH'])
+    monkeypatch.chdir(tmp_path)
+    lPool = VivadoConsolePool(size=2, loglevel='none')
+    yield lPool
+    lPool.close()
+
+
+# -----------------------------------------------------------------------------
+def test_pool_reuse(pool):
+    with VivadoPooledSession(sid='first', pool=pool) as lConsole:
+        assert lConsole.sessionid == 'first'
+        lConsole.execute('create_project top')
+        lPid = lConsole._process.pid
+
+    assert len(pool) == 1
+
+    with VivadoPooledSession(sid='second', pool=pool) as lConsole:
+        assert lConsole._process.pid == lPid
+        # State was reset on release
+        assert lConsole.execute('current_project') == (None,)
+        assert lConsole.execute('get_msg_config -count -severity ERROR')[-1].strip() == '0'
+
+
+# -----------------------------------------------------------------------------
+def test_pool_concurrent_sessions(pool):
+    with VivadoPooledSession(pool=pool) as lFirst, VivadoPooledSession(pool=pool) as lSecond:
+        assert lFirst is not lSecond
+        assert len(pool) == 2
+
+
+# -----------------------------------------------------------------------------
+def test_pool_discards_dead_consoles(pool):
+    lConsole = pool.acquire()
+    lPid = lConsole._process.pid
+    pool.release(lConsole)
+
+    lConsole._process.terminate(force=True)
+
+    lConsole = pool.acquire()
+    assert lConsole.isAlive()
+    assert lConsole._process.pid != lPid
+    pool.release(lConsole)
+
+
+# -----------------------------------------------------------------------------
+def test_pool_prewarm_and_reap(pool):
+    pool.prewarm()
+    lFirst, lSecond = pool.acquire(), pool.acquire()
+    pool.release(lFirst)
+    pool.release(lSecond)
+    assert len(pool) == 2
+
+    pool.idletimeout = 0
+    pool.reap()
+    assert len(pool) == 0
+    assert not lFirst.isAlive() and not lSecond.isAlive()
+
+
+# -----------------------------------------------------------------------------
+def test_available_job_slots():
+    assert availableJobSlots(1) >= 1
+    assert availableJobSlots(1, 1) == 1
+    # Never less than one, even with no memory to spare
+    assert availableJobSlots(2**60) == 1